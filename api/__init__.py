@@ -0,0 +1 @@
+"""API package for CoreLedger dashboard backends."""
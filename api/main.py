@@ -5,22 +5,26 @@ Provides REST API and WebSocket endpoints for real-time data streaming
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
-import json
+import logging
+import numpy as np
+import orjson
 import asyncio
-from typing import List, Dict, Any
-from datetime import datetime
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pydantic import BaseModel, Field
 import uvicorn
-import sys
-import os
 
-# Add parent directory to path to import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.models.database import DatabaseManager
-from src.models.account import AccountRepository  
 from src.ledger import BankLedger
 
+logger = logging.getLogger("coreledger.api")
+
 app = FastAPI(title="CoreLedger API", version="1.0.0")
 
 # Configure CORS for React frontend
@@ -33,84 +37,326 @@ app.add_middleware(
 )
 
 # Database connection
-db = DatabaseManager("multilingual_bank.db")
-ledger = BankLedger(db)
+DB_PATH = "multilingual_bank.db"
+ledger = BankLedger(DB_PATH)
+db = ledger.db_manager
+
+# WAL lets pooled readers run while the writer holds its transaction
+db.connection.execute("PRAGMA journal_mode=WAL")
+db.connection.execute("PRAGMA synchronous=NORMAL")
+db.connection.execute("PRAGMA temp_store=MEMORY")
+
+READ_POOL_SIZE = 4
+
+class _ReadConnectionPool:
+    """Small pool of read-only SQLite connections for dashboard queries.
+
+    All reads previously went through the single shared writer connection,
+    serializing concurrent dashboard requests behind each other and behind
+    writes. With WAL enabled, pooled readers can run side by side.
+    """
+    def __init__(self, db_path: str, size: int = READ_POOL_SIZE):
+        self.db_path = db_path
+        self._pool: list = []
+        self._lock = threading.Lock()
+        self._size = size
+
+    def _new_connection(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        with self._lock:
+            conn = self._pool.pop() if self._pool else self._new_connection()
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if len(self._pool) < self._size:
+                    self._pool.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+read_pool = _ReadConnectionPool(DB_PATH)
+
+# Bound per-client outbound queues so a slow client cannot grow memory unbounded
+BROADCAST_QUEUE_SIZE = 32
+
+# Yield the event loop after this many enqueues so huge fan-outs don't stall it
+BROADCAST_BATCH_SIZE = 50
 
 # WebSocket connections manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self.queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._relay_tasks: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"Client connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        self.queues[websocket] = asyncio.Queue(maxsize=BROADCAST_QUEUE_SIZE)
+        self._relay_tasks[websocket] = asyncio.create_task(self._relay(websocket))
+        logger.info("Client connected. Total connections: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"Client disconnected. Total connections: {len(self.active_connections)}")
+        if websocket not in self.queues:
+            return  # Already cleaned up (relay and endpoint can both get here)
+        self.active_connections.discard(websocket)
+        del self.queues[websocket]
+        task = self._relay_tasks.pop(websocket, None)
+        if task is not None:
+            task.cancel()
+        logger.info("Client disconnected. Total connections: %d", len(self.active_connections))
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast(self, message: str):
-        """Send message to all connected clients"""
-        for connection in self.active_connections:
+    async def _relay(self, websocket: WebSocket):
+        """Drain one client's queue so slow peers only delay themselves.
+
+        Every queued message is a full dashboard snapshot, so when a burst
+        piles up behind a slow send only the newest one needs to go out.
+        """
+        queue = self.queues[websocket]
+        try:
+            while True:
+                message = await queue.get()
+                while not queue.empty():
+                    message = queue.get_nowait()
+                await websocket.send_bytes(message)
+        except asyncio.CancelledError:
+            raise
+        except (WebSocketDisconnect, ConnectionError, RuntimeError):
+            # The peer is gone (or the socket is mid-close); reap it now so
+            # future broadcasts only pay for live clients
+            self.disconnect(websocket)
+
+    async def broadcast(self, message: bytes):
+        """Enqueue a message for all connected clients without awaiting sends"""
+        for i, queue in enumerate(list(self.queues.values())):
             try:
-                await connection.send_text(message)
-            except:
-                # Connection might be closed
-                pass
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Drop the oldest pending message to bound memory
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                queue.put_nowait(message)
+            # For large fan-outs, yield periodically so in-flight requests
+            # keep being served; small deployments never hit this branch.
+            if i % BROADCAST_BATCH_SIZE == BROADCAST_BATCH_SIZE - 1:
+                await asyncio.sleep(0)
 
 manager = ConnectionManager()
 
+# Dashboard cache: rebuilding the dashboard runs several SQL queries, so the
+# result is memoized for a short TTL and invalidated whenever a mutation lands.
+DASHBOARD_CACHE_TTL = 0.5  # seconds
+
+class _DashboardCache:
+    """Holds the last built dashboard dict and its validity window."""
+    def __init__(self):
+        self.data = None
+        self.json_bytes = None
+        self.balances = None  # float64 SoA snapshot of account balances
+        self.expires_at = 0.0
+        self.version = -1
+
+_dashboard_cache = _DashboardCache()
+_dirty_version = 0
+
+def _mark_dashboard_dirty():
+    """Invalidate the cached dashboard after a mutation."""
+    global _dirty_version
+    _dirty_version += 1
+
+def _wrap_update(payload: bytes) -> bytes:
+    """Wrap a serialized dashboard payload in the broadcast envelope."""
+    return b'{"type":"dashboard_update","data":' + payload + b'}'
+
+# Broadcast coalescing: mutations only flag the dashboard as pending; a single
+# background task rebuilds and broadcasts at most once per debounce interval,
+# so a burst of writes produces one fan-out instead of one per write.
+BROADCAST_DEBOUNCE_SECONDS = 0.1
+
+_broadcast_pending = asyncio.Event()
+_broadcaster_task = None
+
+def _schedule_broadcast():
+    """Request a dashboard broadcast; bursts are coalesced by the broadcaster."""
+    _broadcast_pending.set()
+
+async def _broadcaster():
+    """Serve pending broadcast requests at most once per debounce interval."""
+    while True:
+        await _broadcast_pending.wait()
+        await asyncio.sleep(BROADCAST_DEBOUNCE_SECONDS)
+        # Clear after the sleep: mutations during the window ride this push
+        _broadcast_pending.clear()
+        try:
+            await manager.broadcast(_wrap_update(await get_dashboard_payload()))
+        except Exception:
+            # A transient failure (e.g. a locked database) must not kill
+            # the task; the next scheduled broadcast retries
+            logger.exception("Dashboard broadcast failed")
+
+@app.on_event("startup")
+async def _start_broadcaster():
+    global _broadcaster_task
+    _broadcaster_task = asyncio.create_task(_broadcaster())
+
+
+# Dashboard SQL, prepared once at import so sqlite3's statement cache can
+# reuse the parsed statements across rebuilds. The counters use plain
+# range predicates on created_at (instead of date()/strftime() on the
+# column) so the planner can seek the created_at index rather than scan
+# the whole transactions table.
+_STMT_COUNTERS = """
+    SELECT
+        (SELECT COUNT(*) FROM transactions
+         WHERE created_at >= ? AND created_at < ?) AS today,
+        (SELECT COUNT(*) FROM transactions
+         WHERE created_at >= ? AND created_at < ?) AS month
+"""
+
+_STMT_TYPES = """
+    SELECT transaction_type, COUNT(*) as count
+    FROM transactions
+    GROUP BY transaction_type
+"""
+
+_STMT_RECENT = """
+    SELECT id, from_account_id, to_account_id, amount,
+           transaction_type, description, created_at
+    FROM transactions
+    ORDER BY created_at DESC
+    LIMIT 10
+"""
+
 # Helper functions
 def format_decimal(value):
     """Convert Decimal to float for JSON serialization"""
     return float(value) if value else 0.0
 
-def get_dashboard_data():
-    """Get current dashboard data"""
+# Account creation timestamps never change, so their isoformat strings are
+# computed once per account instead of once per rebuild
+_created_iso_cache: Dict[Any, str] = {}
+
+def _created_iso(account):
+    """Return the cached isoformat string for an account's created_at."""
+    iso = _created_iso_cache.get(account.id)
+    if iso is None and account.created_at is not None:
+        iso = account.created_at.isoformat()
+        _created_iso_cache[account.id] = iso
+    return iso
+
+async def get_dashboard_data():
+    """Get current dashboard data, served from the cache when fresh"""
+    cache = _dashboard_cache
+    if (cache.data is not None
+            and cache.version == _dirty_version
+            and time.monotonic() < cache.expires_at):
+        return cache.data
+
+    # The SQLite work is synchronous; each independent read runs on its own
+    # worker thread (and its own pooled connection), so the rebuild costs
+    # the slowest query instead of the sum of all of them and the event
+    # loop keeps serving broadcasts and in-flight requests meanwhile.
+    version = _dirty_version
+    accounts_section, counters, transaction_types, recent_rows = await asyncio.gather(
+        asyncio.to_thread(_fetch_accounts_section),
+        asyncio.to_thread(_fetch_counters),
+        asyncio.to_thread(_fetch_types),
+        asyncio.to_thread(_fetch_recent),
+    )
+    data = _assemble_dashboard(accounts_section, counters,
+                               transaction_types, recent_rows)
+    cache.data = data
+    cache.json_bytes = orjson.dumps(data, default=float)
+    cache.version = version
+    cache.expires_at = time.monotonic() + DASHBOARD_CACHE_TTL
+    return data
+
+async def get_dashboard_payload() -> bytes:
+    """Get the dashboard serialized as JSON bytes, served from the cache"""
+    await get_dashboard_data()
+    return _dashboard_cache.json_bytes
+
+def _fetch_accounts_section():
+    """Fetch accounts and shape the account-derived dashboard pieces"""
     accounts = ledger.account_repo.get_all_accounts()
-    
-    # Calculate totals
-    total_balance = sum(account.balance for account in accounts)
     total_accounts = len(accounts)
-    
-    # Get recent transactions
-    cursor = db.connection.cursor()
-    cursor.execute("""
-        SELECT COUNT(*) FROM transactions 
-        WHERE date(created_at) = date('now')
-    """)
-    today_transactions = cursor.fetchone()[0]
-    
-    cursor.execute("""
-        SELECT COUNT(*) FROM transactions 
-        WHERE strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
-    """)
-    month_transactions = cursor.fetchone()[0]
-    
-    # Get transaction types distribution
-    cursor.execute("""
-        SELECT transaction_type, COUNT(*) as count
-        FROM transactions 
-        GROUP BY transaction_type
-    """)
-    transaction_types = [{"type": row[0], "count": row[1]} for row in cursor.fetchall()]
-    
-    # Get recent transactions for timeline
-    cursor.execute("""
-        SELECT t.*, a1.name as from_name, a2.name as to_name
-        FROM transactions t
-        LEFT JOIN accounts a1 ON t.from_account_id = a1.id
-        LEFT JOIN accounts a2 ON t.to_account_id = a2.id
-        ORDER BY t.created_at DESC
-        LIMIT 10
-    """)
-    recent_transactions = []
-    for row in cursor.fetchall():
-        recent_transactions.append({
+
+    # Balances go into a float64 array so the total is a single vectorized
+    # reduction rather than a Python-level sum over Decimal objects; the
+    # array is kept on the cache for any further per-account aggregations.
+    balances = np.fromiter(
+        (format_decimal(account.balance) for account in accounts),
+        dtype=np.float64, count=total_accounts,
+    )
+    total_balance = float(balances.sum())
+
+    # Comprehensions keep the row-shaping loops free of repeated
+    # attribute lookups and method dispatch on the hot rebuild path
+    accounts_json = [
+        {
+            "id": str(account.id),
+            "name": account.name,
+            "balance": float(balance),
+            "created_at": _created_iso(account)
+        }
+        for account, balance in zip(accounts, balances)
+    ]
+    _dashboard_cache.balances = balances
+
+    # Account names for recent transactions are resolved from memory, so
+    # the recent query needs no joins; transactions store account ids as
+    # TEXT, so key the lookup by both representations.
+    id_to_name = {}
+    for account in accounts:
+        id_to_name[account.id] = account.name
+        id_to_name[str(account.id)] = account.name
+
+    return total_accounts, total_balance, accounts_json, id_to_name
+
+def _fetch_counters():
+    """Fetch the today/month transaction counters on a pooled reader"""
+    # Bounds are UTC dates because SQLite's CURRENT_TIMESTAMP stores UTC
+    today = datetime.now(timezone.utc).date()
+    tomorrow = today + timedelta(days=1)
+    month_start = today.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    with read_pool.acquire() as conn:
+        cursor = conn.execute(_STMT_COUNTERS, (
+            today.isoformat(), tomorrow.isoformat(),
+            month_start.isoformat(), next_month.isoformat(),
+        ))
+        return cursor.fetchone()
+
+def _fetch_types():
+    """Fetch the transaction-type distribution on a pooled reader"""
+    with read_pool.acquire() as conn:
+        rows = conn.execute(_STMT_TYPES).fetchall()
+    return [{"type": row[0], "count": row[1]} for row in rows]
+
+def _fetch_recent():
+    """Fetch the latest transactions for the timeline on a pooled reader"""
+    with read_pool.acquire() as conn:
+        return conn.execute(_STMT_RECENT).fetchall()
+
+def _assemble_dashboard(accounts_section, counters, transaction_types, recent_rows):
+    """Combine the independently fetched pieces into the dashboard dict"""
+    total_accounts, total_balance, accounts_json, id_to_name = accounts_section
+    today_transactions, month_transactions = counters
+
+    recent_transactions = [
+        {
             "id": row[0],
             "from_account_id": row[1],
             "to_account_id": row[2],
@@ -118,13 +364,15 @@ def get_dashboard_data():
             "type": row[4],
             "description": row[5],
             "created_at": row[6],
-            "from_name": row[7],
-            "to_name": row[8]
-        })
-    
+            "from_name": id_to_name.get(row[1]),
+            "to_name": id_to_name.get(row[2])
+        }
+        for row in recent_rows
+    ]
+
     return {
         "kpis": {
-            "total_balance": format_decimal(total_balance),
+            "total_balance": total_balance,
             "total_accounts": total_accounts,
             "today_transactions": today_transactions,
             "month_transactions": month_transactions,
@@ -133,18 +381,32 @@ def get_dashboard_data():
         "charts": {
             "transaction_types": transaction_types,
             "recent_transactions": recent_transactions,
-            "accounts": [
-                {
-                    "id": str(account.id),
-                    "name": account.name,
-                    "balance": format_decimal(account.balance),
-                    "created_at": account.created_at.isoformat() if account.created_at else None
-                }
-                for account in accounts
-            ]
+            "accounts": accounts_json
         }
     }
 
+# Request bodies: validated by pydantic-core up front, so the handlers
+# start from typed, range-checked values instead of dict.get + float()
+class AccountCreateIn(BaseModel):
+    name: str = Field(min_length=1)
+    initial_balance: Decimal = Field(default=Decimal("0.00"), ge=0)
+
+class DepositIn(BaseModel):
+    account_id: int
+    amount: Decimal = Field(gt=0)
+    description: str = ""
+
+class WithdrawalIn(BaseModel):
+    account_id: int
+    amount: Decimal = Field(gt=0)
+    description: str = ""
+
+class TransferIn(BaseModel):
+    from_account_id: int
+    to_account_id: int
+    amount: Decimal = Field(gt=0)
+    description: str = ""
+
 # REST API Endpoints
 @app.get("/")
 async def root():
@@ -153,194 +415,141 @@ async def root():
 @app.get("/api/dashboard")
 async def get_dashboard():
     """Get complete dashboard data"""
-    return get_dashboard_data()
+    return Response(content=await get_dashboard_payload(), media_type="application/json")
 
 @app.get("/api/accounts")
 async def get_accounts():
-    """Get all accounts"""
-    accounts = ledger.account_repo.get_all_accounts()
-    return [
-        {
-            "id": str(account.id),
-            "name": account.name,
-            "balance": format_decimal(account.balance),
-            "created_at": account.created_at.isoformat() if account.created_at else None
-        }
-        for account in accounts
-    ]
+    """Get all accounts (from the cached dashboard snapshot)"""
+    return (await get_dashboard_data())["charts"]["accounts"]
 
 @app.post("/api/accounts")
-async def create_account(account_data: dict):
+async def create_account(body: AccountCreateIn):
     """Create a new account"""
     try:
-        name = account_data.get("name")
-        initial_balance = account_data.get("initial_balance", 0)
-        
-        if not name:
-            raise HTTPException(status_code=400, detail="Account name is required")
-        
-        account = ledger.create_account(name, initial_balance)
-        
-        # Broadcast update to all connected clients
-        dashboard_data = get_dashboard_data()
-        await manager.broadcast(json.dumps({
-            "type": "dashboard_update",
-            "data": dashboard_data
-        }))
-        
-        return {
-            "id": str(account.id),
-            "name": account.name,
-            "balance": format_decimal(account.balance),
-            "created_at": account.created_at.isoformat()
-        }
+        account_id = ledger.create_account(body.name, body.initial_balance)
+        account = ledger.get_account(account_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    _mark_dashboard_dirty()
+    _schedule_broadcast()
+
+    return {
+        "id": str(account.id),
+        "name": account.name,
+        "balance": format_decimal(account.balance),
+        "created_at": account.created_at.isoformat()
+    }
+
 @app.post("/api/transactions/deposit")
-async def deposit(transaction_data: dict):
+async def deposit(body: DepositIn):
     """Make a deposit"""
     try:
-        account_id = transaction_data.get("account_id")
-        amount = float(transaction_data.get("amount", 0))
-        description = transaction_data.get("description", "")
-        
-        if not account_id or amount <= 0:
-            raise HTTPException(status_code=400, detail="Valid account_id and amount required")
-        
-        success = ledger.deposit(account_id, amount, description)
-        
-        if success:
-            # Broadcast update to all connected clients
-            dashboard_data = get_dashboard_data()
-            await manager.broadcast(json.dumps({
-                "type": "dashboard_update",
-                "data": dashboard_data
-            }))
-            
-            return {"success": True, "message": "Deposit successful"}
-        else:
-            raise HTTPException(status_code=400, detail="Deposit failed")
-            
+        ledger.deposit(body.account_id, body.amount, body.description)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    _mark_dashboard_dirty()
+    _schedule_broadcast()
+
+    return {"success": True, "message": "Deposit successful"}
+
 @app.post("/api/transactions/withdrawal")
-async def withdrawal(transaction_data: dict):
+async def withdrawal(body: WithdrawalIn):
     """Make a withdrawal"""
     try:
-        account_id = transaction_data.get("account_id")
-        amount = float(transaction_data.get("amount", 0))
-        description = transaction_data.get("description", "")
-        
-        if not account_id or amount <= 0:
-            raise HTTPException(status_code=400, detail="Valid account_id and amount required")
-        
-        success = ledger.withdraw(account_id, amount, description)
-        
-        if success:
-            # Broadcast update to all connected clients
-            dashboard_data = get_dashboard_data()
-            await manager.broadcast(json.dumps({
-                "type": "dashboard_update",
-                "data": dashboard_data
-            }))
-            
-            return {"success": True, "message": "Withdrawal successful"}
-        else:
-            raise HTTPException(status_code=400, detail="Insufficient funds or withdrawal failed")
-            
+        ledger.withdraw(body.account_id, body.amount, body.description)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    _mark_dashboard_dirty()
+    _schedule_broadcast()
+
+    return {"success": True, "message": "Withdrawal successful"}
+
 @app.post("/api/transactions/transfer")
-async def transfer(transaction_data: dict):
+async def transfer(body: TransferIn):
     """Make a transfer between accounts"""
     try:
-        from_account_id = transaction_data.get("from_account_id")
-        to_account_id = transaction_data.get("to_account_id")
-        amount = float(transaction_data.get("amount", 0))
-        description = transaction_data.get("description", "")
-        
-        if not from_account_id or not to_account_id or amount <= 0:
-            raise HTTPException(status_code=400, detail="Valid account IDs and amount required")
-        
-        success = ledger.transfer(from_account_id, to_account_id, amount, description)
-        
-        if success:
-            # Broadcast update to all connected clients
-            dashboard_data = get_dashboard_data()
-            await manager.broadcast(json.dumps({
-                "type": "dashboard_update",
-                "data": dashboard_data
-            }))
-            
-            return {"success": True, "message": "Transfer successful"}
-        else:
-            raise HTTPException(status_code=400, detail="Transfer failed")
-            
+        ledger.transfer(body.from_account_id, body.to_account_id,
+                        body.amount, body.description)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    _mark_dashboard_dirty()
+    _schedule_broadcast()
+
+    return {"success": True, "message": "Transfer successful"}
+
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
-        # Send initial dashboard data
-        dashboard_data = get_dashboard_data()
-        await websocket.send_text(json.dumps({
-            "type": "dashboard_update",
-            "data": dashboard_data
-        }))
+        # Send initial dashboard data as a binary frame: the payload is JSON
+        # either way, and send_bytes skips the outbound UTF-8 validation pass
+        await websocket.send_bytes(_wrap_update(await get_dashboard_payload()))
         
         # Keep connection alive and handle incoming messages
         while True:
             data = await websocket.receive_text()
             # Echo back for now, could handle specific client requests
             await websocket.send_text(f"Echo: {data}")
-            
-    except WebSocketDisconnect:
+
+    except (WebSocketDisconnect, ConnectionError, RuntimeError):
+        # Catching only WebSocketDisconnect here used to leak the manager
+        # entry when the socket died mid-send with a RuntimeError
         manager.disconnect(websocket)
 
-# Real-time data simulator (for testing)
+# Real-time data simulator (for testing); the RNG lives at module scope so
+# each request avoids rebuilding generator state and candidate lists
+_rng = np.random.default_rng()
+_TX_TYPES = ("deposit", "withdrawal", "transfer")
+
 @app.post("/api/simulate/random-transaction")
 async def simulate_random_transaction():
     """Simulate a random transaction for testing real-time updates"""
-    import random
-    
-    accounts = ledger.account_repo.get_all_accounts()
+    # Pick from the cached snapshot instead of re-querying the account table
+    accounts = (await get_dashboard_data())["charts"]["accounts"]
     if len(accounts) < 2:
         raise HTTPException(status_code=400, detail="Need at least 2 accounts for simulation")
-    
-    # Random transaction type
-    transaction_types = ["deposit", "withdrawal", "transfer"]
-    trans_type = random.choice(transaction_types)
-    amount = round(random.uniform(10, 500), 2)
-    
+
+    trans_type = _TX_TYPES[_rng.integers(len(_TX_TYPES))]
+    amount = round(float(_rng.uniform(10, 500)), 2)
+
     try:
         if trans_type == "deposit":
-            account = random.choice(accounts)
-            ledger.deposit(account.id, amount, "Simulated deposit")
+            account = accounts[_rng.integers(len(accounts))]
+            ledger.deposit(int(account["id"]), amount, "Simulated deposit")
         elif trans_type == "withdrawal":
-            account = random.choice(accounts)
-            ledger.withdraw(account.id, amount, "Simulated withdrawal")
+            account = accounts[_rng.integers(len(accounts))]
+            ledger.withdraw(int(account["id"]), amount, "Simulated withdrawal")
         else:  # transfer
-            from_acc = random.choice(accounts)
-            to_acc = random.choice([acc for acc in accounts if acc.id != from_acc.id])
-            ledger.transfer(from_acc.id, to_acc.id, amount, "Simulated transfer")
-        
-        # Broadcast update
-        dashboard_data = get_dashboard_data()
-        await manager.broadcast(json.dumps({
-            "type": "dashboard_update",
-            "data": dashboard_data
-        }))
-        
+            # Two distinct indices in one draw instead of filtering a new list
+            i, j = _rng.choice(len(accounts), size=2, replace=False)
+            ledger.transfer(int(accounts[i]["id"]), int(accounts[j]["id"]),
+                            amount, "Simulated transfer")
+
+        _mark_dashboard_dirty()
+        _schedule_broadcast()
+
         return {"success": True, "transaction_type": trans_type, "amount": amount}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # WARNING keeps connection-churn messages off the event loop in
+    # production; raise to INFO when debugging websocket lifecycles
+    logging.basicConfig(level=logging.WARNING)
+
+    # uvloop roughly doubles socket throughput but is not available on
+    # Windows, where the .bat launchers run this module.
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop,
+                http="httptools", ws="websockets", reload=False)
\ No newline at end of file
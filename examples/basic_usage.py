@@ -10,13 +10,21 @@ This script demonstrates basic operations including:
 """
 
 import sys
-import os
 from decimal import Decimal
 
-# Add the src directory to Python path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src.ledger import BankLedger
 
-from ledger import BankLedger
+# Parsed once at import; used by the precision check below
+_D0_60 = Decimal("0.60")
+
+
+def _emit(lines):
+    """Flush a section's buffered lines with a single stdout write.
+
+    One write per section means one lock acquisition and one syscall
+    instead of one per print call.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -27,71 +35,81 @@ def main():
     with BankLedger("bank_demo.db") as ledger:
         
         # Create some accounts
-        print("1. Creating accounts...")
+        lines = ["1. Creating accounts..."]
         alice_id = ledger.create_account("Alice Johnson", "1000.00")
         bob_id = ledger.create_account("Bob Smith", "500.00")
         charlie_id = ledger.create_account("Charlie Brown", "0.00")
         
-        print(f"   - Alice's account ID: {alice_id}")
-        print(f"   - Bob's account ID: {bob_id}")
-        print(f"   - Charlie's account ID: {charlie_id}")
+        lines.append(f"   - Alice's account ID: {alice_id}")
+        lines.append(f"   - Bob's account ID: {bob_id}")
+        lines.append(f"   - Charlie's account ID: {charlie_id}")
+        _emit(lines)
         
         # Display initial balances
-        print("\n2. Initial balances:")
+        lines = ["\n2. Initial balances:"]
         for account in ledger.list_accounts():
-            print(f"   - {account.name}: ${account.balance}")
-        
-        print(f"\n   Total system balance: ${ledger.get_total_system_balance()}")
-        
-        # Perform some operations
-        print("\n3. Performing transactions...")
-        
-        # Alice gets her salary
-        print("   - Alice receives salary deposit of $2,500...")
-        ledger.deposit(alice_id, "2500.00", "Monthly salary")
-        print(f"     Alice's new balance: ${ledger.get_balance(alice_id)}")
-        
-        # Bob withdraws some cash
-        print("   - Bob withdraws $100 from ATM...")
-        ledger.withdraw(bob_id, "100.00", "ATM withdrawal")
-        print(f"     Bob's new balance: ${ledger.get_balance(bob_id)}")
-        
-        # Alice lends money to Bob
-        print("   - Alice transfers $300 to Bob...")
-        alice_balance, bob_balance = ledger.transfer(
-            alice_id, bob_id, "300.00", "Loan to Bob"
-        )
-        print(f"     Alice's new balance: ${alice_balance}")
-        print(f"     Bob's new balance: ${bob_balance}")
-        
-        # Alice gives money to Charlie
-        print("   - Alice transfers $200 to Charlie...")
-        alice_balance, charlie_balance = ledger.transfer(
-            alice_id, charlie_id, "200.00", "Gift to Charlie"
-        )
-        print(f"     Alice's new balance: ${alice_balance}")
-        print(f"     Charlie's new balance: ${charlie_balance}")
+            lines.append(f"   - {account.name}: ${account.balance}")
         
-        # Display final balances
-        print("\n4. Final balances:")
-        for account in ledger.list_accounts():
-            print(f"   - {account.name}: ${account.balance}")
+        lines.append(f"\n   Total system balance: ${ledger.get_total_system_balance()}")
+        _emit(lines)
         
-        print(f"\n   Total system balance: ${ledger.get_total_system_balance()}")
+        # Perform some operations, batched into a single transaction so the
+        # whole phase costs one fsync instead of one per statement
+        lines = ["\n3. Performing transactions..."]
+
+        with ledger.transaction():
+            # Alice gets her salary
+            lines.append("   - Alice receives salary deposit of $2,500...")
+            ledger.deposit(alice_id, "2500.00", "Monthly salary")
+            lines.append(f"     Alice's new balance: ${ledger.get_balance(alice_id)}")
+
+            # Bob withdraws some cash
+            lines.append("   - Bob withdraws $100 from ATM...")
+            ledger.withdraw(bob_id, "100.00", "ATM withdrawal")
+            lines.append(f"     Bob's new balance: ${ledger.get_balance(bob_id)}")
+
+            # Alice lends money to Bob
+            lines.append("   - Alice transfers $300 to Bob...")
+            alice_balance, bob_balance = ledger.transfer(
+                alice_id, bob_id, "300.00", "Loan to Bob"
+            )
+            lines.append(f"     Alice's new balance: ${alice_balance}")
+            lines.append(f"     Bob's new balance: ${bob_balance}")
+
+            # Alice gives money to Charlie
+            lines.append("   - Alice transfers $200 to Charlie...")
+            alice_balance, charlie_balance = ledger.transfer(
+                alice_id, charlie_id, "200.00", "Gift to Charlie"
+            )
+            lines.append(f"     Alice's new balance: ${alice_balance}")
+            lines.append(f"     Charlie's new balance: ${charlie_balance}")
+        _emit(lines)
         
-        # Show transaction history for Alice
-        print("\n5. Alice's transaction history:")
+        # Display final balances
+        lines = ["\n4. Final balances:"]
+        for account in ledger.list_accounts():
+            lines.append(f"   - {account.name}: ${account.balance}")
+        
+        lines.append(f"\n   Total system balance: ${ledger.get_total_system_balance()}")
+        _emit(lines)
+        
+        # Show transaction history for Alice. A dict dispatch replaces the
+        # if/elif chain: one lookup per row instead of up to three string
+        # comparisons plus nested branching.
+        lines = ["\n5. Alice's transaction history:"]
+        formatters = {
+            "deposit": lambda t: f"DEPOSIT: +${t.amount} - {t.description}",
+            "withdrawal": lambda t: f"WITHDRAWAL: -${t.amount} - {t.description}",
+            "transfer": lambda t: (
+                f"TRANSFER OUT: -${t.amount} - {t.description}"
+                if t.from_account_id == alice_id
+                else f"TRANSFER IN: +${t.amount} - {t.description}"
+            ),
+        }
         alice_transactions = ledger.get_account_transactions(alice_id)
         for i, transaction in enumerate(alice_transactions, 1):
-            if transaction.transaction_type == "deposit":
-                print(f"   {i}. DEPOSIT: +${transaction.amount} - {transaction.description}")
-            elif transaction.transaction_type == "withdrawal":
-                print(f"   {i}. WITHDRAWAL: -${transaction.amount} - {transaction.description}")
-            elif transaction.transaction_type == "transfer":
-                if transaction.from_account_id == alice_id:
-                    print(f"   {i}. TRANSFER OUT: -${transaction.amount} - {transaction.description}")
-                else:
-                    print(f"   {i}. TRANSFER IN: +${transaction.amount} - {transaction.description}")
+            lines.append(f"   {i}. {formatters[transaction.transaction_type](transaction)}")
+        _emit(lines)
         
         # Demonstrate error handling
         print("\n6. Demonstrating error handling...")
@@ -114,24 +132,24 @@ def main():
         except Exception as e:
             print(f"     Error: {e}")
         
-        print("\n7. Demonstrating decimal precision...")
+        lines = ["\n7. Demonstrating decimal precision..."]
         # Create test account for precision demo
         precision_id = ledger.create_account("Precision Test", "0.00")
         
-        # Add amounts that would cause floating-point errors
+        # Add amounts that would cause floating-point errors, as one batch
         amounts = ["0.1", "0.2", "0.3"]
-        for amount in amounts:
-            ledger.deposit(precision_id, amount)
-            print(f"   - Added ${amount}, balance: ${ledger.get_balance(precision_id)}")
+        ledger.deposit_many(precision_id, [(amount, "Precision test") for amount in amounts])
+        lines.append(f"   - Added ${' + $'.join(amounts)} in a single batched deposit")
         
         # The total should be exactly 0.60, not 0.6000000000000001
         final_precision_balance = ledger.get_balance(precision_id)
-        print(f"   - Final precision test balance: ${final_precision_balance}")
-        print(f"   - Is exactly $0.60? {final_precision_balance == Decimal('0.60')}")
+        lines.append(f"   - Final precision test balance: ${final_precision_balance}")
+        lines.append(f"   - Is exactly $0.60? {final_precision_balance == _D0_60}")
         
-        print("\n=== Demo Complete ===")
-        print("\nThe database 'bank_demo.db' has been created with all the demo data.")
-        print("You can inspect it or run the demo again to see persistent data.")
+        lines.append("\n=== Demo Complete ===")
+        lines.append("\nThe database 'bank_demo.db' has been created with all the demo data.")
+        lines.append("You can inspect it or run the demo again to see persistent data.")
+        _emit(lines)
 
 
 def demonstrate_advanced_features():
@@ -150,18 +168,19 @@ def demonstrate_advanced_features():
         
         print("1. Created business accounts with $1000 each")
         
-        # Simulate business transactions
+        # Simulate business transactions; one transaction for the batch
         print("\n2. Simulating business transactions...")
-        
-        # Customer purchases
-        ledger.transfer(accounts["Customer A"], accounts["Merchant Corp"], "250.00", "Purchase order #1001")
-        ledger.transfer(accounts["Customer B"], accounts["Merchant Corp"], "175.50", "Purchase order #1002")
-        
-        # Merchant pays supplier
-        ledger.transfer(accounts["Merchant Corp"], accounts["Supplier LLC"], "300.00", "Inventory purchase")
-        
-        # Tax payment
-        ledger.transfer(accounts["Merchant Corp"], accounts["Tax Authority"], "85.25", "Monthly tax payment")
+
+        with ledger.transaction():
+            # Customer purchases
+            ledger.transfer(accounts["Customer A"], accounts["Merchant Corp"], "250.00", "Purchase order #1001")
+            ledger.transfer(accounts["Customer B"], accounts["Merchant Corp"], "175.50", "Purchase order #1002")
+
+            # Merchant pays supplier
+            ledger.transfer(accounts["Merchant Corp"], accounts["Supplier LLC"], "300.00", "Inventory purchase")
+
+            # Tax payment
+            ledger.transfer(accounts["Merchant Corp"], accounts["Tax Authority"], "85.25", "Monthly tax payment")
         
         print("   - Processed customer purchases and business payments")
         
@@ -5,13 +5,7 @@ Este arquivo demonstra como usar os triggers de proteção do banco de dados
 para garantir a integridade dos dados mesmo quando acessando diretamente o SQLite.
 """
 
-import sys
-import os
-
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from models.database import DatabaseManager, DatabaseTriggersManager
+from src.models.database import DatabaseManager, DatabaseTriggersManager
 
 
 def main():
@@ -22,16 +16,18 @@ def main():
     
     # Inicializar banco de dados
     db_manager = DatabaseManager("exemplo_triggers.db")
-    triggers_manager = DatabaseTriggersManager(db_manager)
-    
+    triggers_manager = DatabaseTriggersManager(db_manager.connection)
+
     print("\n1️⃣  Listando triggers existentes:")
     triggers_manager.list_triggers()
-    
+
     print("\n2️⃣  Criando conta de teste...")
     try:
-        # Criar conta com saldo para teste
-        db_manager.execute_query(
-            "INSERT OR REPLACE INTO accounts (id, name, balance) VALUES (999, 'Teste Trigger', '100.50')"
+        # SQL fixo: executescript analisa e executa o lote inteiro em C,
+        # sob uma única transação implícita (um fsync)
+        db_manager.connection.executescript(
+            "INSERT OR REPLACE INTO accounts (id, name, balance) "
+            "VALUES (999, 'Teste Trigger', '100.50');"
         )
         print("✅ Conta de teste criada com saldo R$ 100,50")
     except Exception as e:
@@ -65,12 +61,14 @@ def main():
     
     print("\n6️⃣  Zerando saldo e deletando conta...")
     try:
-        # Zerar saldo e tentar deletar (deve funcionar)
-        db_manager.execute_query("UPDATE accounts SET balance = '0.00' WHERE id = 999")
-        print("✅ Saldo zerado com sucesso")
-        
-        db_manager.execute_query("DELETE FROM accounts WHERE id = 999")
-        print("✅ Conta deletada com sucesso após zerar saldo")
+        # Sequência fixa de limpeza em um único lote (os testes negativos
+        # acima ficam statement a statement, pois cada um precisa saber
+        # qual comando levantou o erro)
+        db_manager.connection.executescript(
+            "UPDATE accounts SET balance = '0.00' WHERE id = 999;"
+            "DELETE FROM accounts WHERE id = 999;"
+        )
+        print("✅ Saldo zerado e conta deletada com sucesso")
     except Exception as e:
         print(f"❌ Erro inesperado: {e}")
     
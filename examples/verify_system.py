@@ -6,14 +6,23 @@ the system is working correctly.
 """
 
 import sys
-import os
 from decimal import Decimal
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src.ledger import BankLedger
+from src.models.account import InsufficientFundsError, InvalidAmountError
 
-from ledger import BankLedger
-from models.account import InsufficientFundsError, InvalidAmountError
+# Decimal constants for the assertions below, parsed once at import time
+# instead of re-parsing the string literal on every check
+_D25 = Decimal("25.00")
+_D50 = Decimal("50.00")
+_D400 = Decimal("400.00")
+_D500 = Decimal("500.00")
+_D700 = Decimal("700.00")
+_D900_50 = Decimal("900.50")
+_D1000 = Decimal("1000.00")
+_D1200_50 = Decimal("1200.50")
+_D0_06 = Decimal("0.06")
+_D11_06 = Decimal("11.06")
 
 
 def test_basic_operations():
@@ -25,21 +34,20 @@ def test_basic_operations():
         alice_id = ledger.create_account("Alice", "1000.00")
         bob_id = ledger.create_account("Bob", "500.00")
         
-        assert ledger.get_balance(alice_id) == Decimal("1000.00")
-        assert ledger.get_balance(bob_id) == Decimal("500.00")
+        assert ledger.get_balance(alice_id) == _D1000
+        assert ledger.get_balance(bob_id) == _D500
         
-        # Test deposit
-        ledger.deposit(alice_id, "200.50")
-        assert ledger.get_balance(alice_id) == Decimal("1200.50")
-        
-        # Test withdrawal
-        ledger.withdraw(bob_id, "100.00")
-        assert ledger.get_balance(bob_id) == Decimal("400.00")
-        
-        # Test transfer
-        ledger.transfer(alice_id, bob_id, "300.00")
-        assert ledger.get_balance(alice_id) == Decimal("900.50")
-        assert ledger.get_balance(bob_id) == Decimal("700.00")
+        # Test deposit/withdrawal/transfer, batched into one transaction
+        with ledger.transaction():
+            ledger.deposit(alice_id, "200.50")
+            assert ledger.get_balance(alice_id) == _D1200_50
+
+            ledger.withdraw(bob_id, "100.00")
+            assert ledger.get_balance(bob_id) == _D400
+
+            ledger.transfer(alice_id, bob_id, "300.00")
+            assert ledger.get_balance(alice_id) == _D900_50
+            assert ledger.get_balance(bob_id) == _D700
         
         print("✓ Basic operations passed")
 
@@ -88,12 +96,12 @@ def test_precision():
         ledger.deposit(account_id, "0.03")
         
         balance = ledger.get_balance(account_id)
-        assert balance == Decimal("0.06"), f"Expected 0.06, got {balance}"
+        assert balance == _D0_06, f"Expected 0.06, got {balance}"
         
         # Test rounding
         ledger.deposit(account_id, "10.999")  # Should round to 11.00
         balance = ledger.get_balance(account_id)
-        assert balance == Decimal("11.06"), f"Expected 11.06, got {balance}"
+        assert balance == _D11_06, f"Expected 11.06, got {balance}"
         
         print("✓ Precision handling passed")
 
@@ -103,22 +111,25 @@ def test_balance_consistency():
     print("Testing balance consistency...")
     
     with BankLedger(":memory:") as ledger:
-        # Create multiple accounts
+        # Create multiple accounts in one batched transaction (one commit
+        # for the five inserts instead of one each)
         accounts = []
-        for i in range(5):
-            account_id = ledger.create_account(f"User{i}", "100.00")
-            accounts.append(account_id)
+        with ledger.transaction():
+            for i in range(5):
+                account_id = ledger.create_account(f"User{i}", "100.00")
+                accounts.append(account_id)
         
         initial_total = ledger.get_total_system_balance()
-        assert initial_total == Decimal("500.00")
+        assert initial_total == _D500
         
-        # Perform various operations
-        ledger.deposit(accounts[0], "50.00")  # +50
-        ledger.withdraw(accounts[1], "25.00")  # -25
-        ledger.transfer(accounts[2], accounts[3], "30.00")  # no net change
+        # Perform various operations in a single batched transaction
+        with ledger.transaction():
+            ledger.deposit(accounts[0], "50.00")  # +50
+            ledger.withdraw(accounts[1], "25.00")  # -25
+            ledger.transfer(accounts[2], accounts[3], "30.00")  # no net change
         
         final_total = ledger.get_total_system_balance()
-        expected_total = initial_total + Decimal("50.00") - Decimal("25.00")
+        expected_total = initial_total + _D50 - _D25
         
         assert final_total == expected_total, f"Expected {expected_total}, got {final_total}"
         
@@ -133,10 +144,11 @@ def test_transaction_history():
         alice_id = ledger.create_account("Alice", "500.00")
         bob_id = ledger.create_account("Bob", "300.00")
         
-        # Perform operations
-        ledger.deposit(alice_id, "100.00", "Salary")
-        ledger.withdraw(alice_id, "50.00", "ATM")
-        ledger.transfer(alice_id, bob_id, "75.00", "Payment")
+        # Perform operations in a single batched transaction
+        with ledger.transaction():
+            ledger.deposit(alice_id, "100.00", "Salary")
+            ledger.withdraw(alice_id, "50.00", "ATM")
+            ledger.transfer(alice_id, bob_id, "75.00", "Payment")
         
         # Check Alice's transaction history
         alice_transactions = ledger.get_account_transactions(alice_id)
@@ -176,16 +188,18 @@ def run_verification():
             print(f"✗ {test.__name__} failed: {e}")
             failed += 1
     
-    print("-" * 50)
-    print(f"Tests passed: {passed}")
-    print(f"Tests failed: {failed}")
-    
+    # Summary flushed as a single stdout write (one syscall, not five)
+    summary = [
+        "-" * 50,
+        f"Tests passed: {passed}",
+        f"Tests failed: {failed}",
+    ]
     if failed == 0:
-        print("\n🎉 All tests passed! CoreLedger is working correctly.")
-        return True
+        summary.append("\n🎉 All tests passed! CoreLedger is working correctly.")
     else:
-        print(f"\n❌ {failed} tests failed. Please check the implementation.")
-        return False
+        summary.append(f"\n❌ {failed} tests failed. Please check the implementation.")
+    sys.stdout.write("\n".join(summary) + "\n")
+    return failed == 0
 
 
 if __name__ == "__main__":
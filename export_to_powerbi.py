@@ -4,20 +4,184 @@ Gera arquivos CSV e Excel otimizados para análise no Power BI
 """
 
 import pandas as pd
+import numpy as np
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from string import Template
+from openpyxl import Workbook
 from src.models.database import DatabaseManager
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-def export_data_for_powerbi(db_path="multilingual_bank.db", output_dir="powerbi_exports"):
+# Power BI ingere Parquet nativamente e os arquivos ficam menores e mais
+# rápidos de gravar que .xlsx; Excel só é gerado quando pedido
+DEFAULT_FORMATS = ('csv', 'parquet')
+
+# Mapeamentos usados na enriquecimento vetorizado (ver export abaixo)
+TRANSACTION_TYPE_PT = {
+    'deposit': 'Depósito',
+    'withdrawal': 'Saque',
+    'transfer': 'Transferência',
+}
+WEEKDAY_PT = {
+    0: 'Domingo', 1: 'Segunda', 2: 'Terça', 3: 'Quarta',
+    4: 'Quinta', 5: 'Sexta', 6: 'Sábado',
+}
+
+# Linhas por bloco ao transmitir a tabela de transações; limita o pico de
+# memória a um bloco em vez da tabela inteira
+TRANSACTIONS_CHUNK_ROWS = 50_000
+
+TRANSACTIONS_COLUMNS = [
+    'id', 'from_account_id', 'from_account_name', 'to_account_id',
+    'to_account_name', 'amount_numeric', 'amount_text', 'transaction_type',
+    'transaction_type_pt', 'description', 'created_at', 'transaction_date',
+    'year_month', 'year', 'month', 'day', 'weekday', 'weekday_name',
+    'amount_category']
+
+# SQL e template do arquivo de conexão construídos uma vez no load do
+# módulo; reexportações agendadas não re-montam as strings a cada chamada
+_ACCOUNTS_SQL = """
+SELECT id, name as account_name, balance as balance_text, created_at
+FROM accounts
+"""
+
+_TRANSACTIONS_SQL = """
+SELECT id, from_account_id, to_account_id, amount as amount_text,
+       transaction_type, description, created_at
+FROM transactions
+ORDER BY created_at DESC
+"""
+
+_CONNECTION_INFO_TEMPLATE = Template("""
+# Informações de Conexão Power BI - CoreLedger
+# Gerado em: $generated_at
+
+## Arquivos Exportados:
+- accounts.*          - Dados das contas
+- transactions.*      - Dados das transações
+- monthly_summary.*   - Resumo mensal
+- cashflow_analysis.* - Análise de fluxo de caixa
+- kpis.*              - Indicadores principais
+(formatos gerados: $formats)
+
+## Para Power BI Desktop:
+1. Obter Dados → Parquet (preferido) ou Texto/CSV
+2. Selecione os arquivos .parquet (ou .csv) desta pasta
+3. Configure relacionamentos:
+   - accounts[id] ↔ transactions[from_account_id]
+   - accounts[id] ↔ transactions[to_account_id]
+
+## Para conexão direta SQLite:
+1. Obter Dados → SQLite
+2. Selecione: $db_path
+3. Importe tabelas: accounts, transactions
+
+## Campos Principais:
+- Contas: id, account_name, balance_numeric, balance_category
+- Transações: amount_numeric, transaction_type_pt, transaction_date
+- Datas: Use 'transaction_date' para eixos temporais
+""")
+
+
+def _enrich_transactions(df, account_names):
+    """Deriva as colunas calculadas de um bloco de transações (vetorizado).
+
+    Args:
+        df: Bloco cru da tabela transactions
+        account_names: Series nome-da-conta indexada por id
+    """
+    # Dois lookups em hashmap contíguo no lugar dos dois LEFT JOINs que
+    # revarriam a tabela accounts dentro do SQLite. A tabela transactions
+    # guarda os ids como TEXT, então normaliza para numérico antes do map
+    df['from_account_name'] = pd.to_numeric(df['from_account_id']).map(account_names)
+    df['to_account_name'] = pd.to_numeric(df['to_account_id']).map(account_names)
+    df['amount_numeric'] = df['amount_text'].astype(float)
+    # Categorical traduz renomeando as categorias — O(tipos distintos),
+    # não O(linhas) — e armazena códigos int8 em vez de uma string por linha.
+    # Tipos fora do dicionário mantêm o nome original, como antes.
+    type_cat = df['transaction_type'].astype('category')
+    df['transaction_type_pt'] = type_cat.cat.rename_categories(
+        {t: pt for t, pt in TRANSACTION_TYPE_PT.items()
+         if t in type_cat.cat.categories})
+    created = pd.to_datetime(df['created_at'])
+    df['created_at'] = created
+    df['transaction_date'] = created.dt.normalize()
+    df['year_month'] = created.dt.strftime('%Y-%m')
+    df['year'] = created.dt.strftime('%Y')
+    df['month'] = created.dt.strftime('%m')
+    df['day'] = created.dt.strftime('%d')
+    # strftime('%w') do SQLite usa domingo=0; dayofweek do pandas usa segunda=0
+    weekday = (created.dt.dayofweek + 1) % 7
+    df['weekday'] = weekday.astype(str)
+    # Os valores 0-6 já são códigos; from_codes indexa a lista de nomes
+    # diretamente, sem hash por linha
+    df['weekday_name'] = pd.Categorical.from_codes(
+        weekday, categories=[WEEKDAY_PT[i] for i in range(7)])
+    df['amount_category'] = np.select(
+        [df['amount_numeric'] >= 1000,
+         df['amount_numeric'] >= 100],
+        ['Grande', 'Média'],
+        default='Pequena')
+    return df[TRANSACTIONS_COLUMNS]
+
+
+def _normalize_formats(formats):
+    """Valida os formatos pedidos e desabilita Parquet se faltar pyarrow."""
+    formats = tuple(formats)
+    invalid = [f for f in formats if f not in ('csv', 'parquet', 'xlsx')]
+    if invalid:
+        raise ValueError(f"Formatos inválidos: {', '.join(invalid)}")
+    if 'parquet' in formats and not PYARROW_AVAILABLE:
+        print("⚠️  pyarrow não instalado; saída Parquet desabilitada "
+              "(pip install pyarrow)")
+        formats = tuple(f for f in formats if f != 'parquet')
+    return formats
+
+
+def _write_table(df, output_dir, name, formats, executor=None):
+    """Grava um DataFrame em cada formato pedido.
+
+    Com um executor, cada arquivo vira uma tarefa em thread — as escritas
+    são I/O (e deflate de zip no caso do xlsx) que soltam o GIL, então os
+    arquivos independentes saem em paralelo. Retorna os futures para o
+    chamador aguardar.
+    """
+    jobs = []
+    if 'csv' in formats:
+        jobs.append(lambda: df.to_csv(f'{output_dir}/{name}.csv',
+                                      index=False, encoding='utf-8-sig'))
+    if 'parquet' in formats:
+        jobs.append(lambda: df.to_parquet(f'{output_dir}/{name}.parquet',
+                                          compression='zstd', engine='pyarrow'))
+    if 'xlsx' in formats:
+        jobs.append(lambda: df.to_excel(f'{output_dir}/{name}.xlsx', index=False))
+    if executor is None:
+        for job in jobs:
+            job()
+        return []
+    return [executor.submit(job) for job in jobs]
+
+
+def export_data_for_powerbi(db_path="multilingual_bank.db", output_dir="powerbi_exports",
+                            formats=DEFAULT_FORMATS):
     """
     Exporta dados do CoreLedger para formatos compatíveis com Power BI
     
     Args:
         db_path: Caminho para o banco de dados SQLite
         output_dir: Diretório de saída para os arquivos
+        formats: Formatos de saída ('csv', 'parquet' e/ou 'xlsx')
     """
     
+    formats = _normalize_formats(formats)
+
     # Criar diretório de saída se não existir
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -29,207 +193,216 @@ def export_data_for_powerbi(db_path="multilingual_bank.db", output_dir="powerbi_
     
     print("🔄 Conectando ao banco de dados...")
     db = DatabaseManager(db_path)
+    # Escritas de arquivos independentes são sobrepostas em threads; os
+    # futures são aguardados antes do resumo final
+    pool = ThreadPoolExecutor(max_workers=4)
+    futures = []
     
     try:
         print("📊 Exportando dados para Power BI...")
         
         # 1. TABELA DE CONTAS (com cálculos adicionais)
         print("  📋 Exportando contas...")
-        accounts_query = """
-        SELECT 
-            id,
-            name as account_name,
-            CAST(balance AS REAL) as balance_numeric,
-            balance as balance_text,
-            created_at,
-            date(created_at) as created_date,
-            strftime('%Y-%m', created_at) as created_year_month,
-            strftime('%Y', created_at) as created_year,
-            CASE 
-                WHEN CAST(balance AS REAL) >= 10000 THEN 'Alto'
-                WHEN CAST(balance AS REAL) >= 1000 THEN 'Médio'
-                WHEN CAST(balance AS REAL) > 0 THEN 'Baixo'
-                ELSE 'Zero'
-            END as balance_category
-        FROM accounts
-        ORDER BY balance_numeric DESC
-        """
-        
-        accounts_df = pd.read_sql_query(accounts_query, db.connection)
+        # Só as colunas cruas saem do SQLite; categorias e partes de data
+        # são calculadas vetorizadas no pandas (loops em C sobre arrays
+        # contíguos, em vez de CASE/strftime avaliados linha a linha)
+        accounts_df = pd.read_sql_query(_ACCOUNTS_SQL, db.connection)
+        accounts_df['balance_numeric'] = accounts_df['balance_text'].astype(float)
+        created = pd.to_datetime(accounts_df['created_at'])
+        accounts_df['created_date'] = created.dt.strftime('%Y-%m-%d')
+        accounts_df['created_year_month'] = created.dt.strftime('%Y-%m')
+        accounts_df['created_year'] = created.dt.strftime('%Y')
+        accounts_df['balance_category'] = np.select(
+            [accounts_df['balance_numeric'] >= 10000,
+             accounts_df['balance_numeric'] >= 1000,
+             accounts_df['balance_numeric'] > 0],
+            ['Alto', 'Médio', 'Baixo'],
+            default='Zero')
+        accounts_df = accounts_df.sort_values('balance_numeric', ascending=False)
+        accounts_df = accounts_df[[
+            'id', 'account_name', 'balance_numeric', 'balance_text', 'created_at',
+            'created_date', 'created_year_month', 'created_year', 'balance_category']]
         
         # Salvar em múltiplos formatos
-        accounts_df.to_csv(f'{output_dir}/accounts.csv', index=False, encoding='utf-8-sig')
-        accounts_df.to_excel(f'{output_dir}/accounts.xlsx', index=False)
+        futures += _write_table(accounts_df, output_dir, 'accounts', formats, pool)
         
         print(f"    ✅ {len(accounts_df)} contas exportadas")
         
         # 2. TABELA DE TRANSAÇÕES (com dados enriquecidos)
         print("  💰 Exportando transações...")
-        transactions_query = """
-        SELECT 
-            t.id,
-            t.from_account_id,
-            fa.name as from_account_name,
-            t.to_account_id,
-            ta.name as to_account_name,
-            CAST(t.amount AS REAL) as amount_numeric,
-            t.amount as amount_text,
-            t.transaction_type,
-            CASE 
-                WHEN t.transaction_type = 'deposit' THEN 'Depósito'
-                WHEN t.transaction_type = 'withdrawal' THEN 'Saque'
-                WHEN t.transaction_type = 'transfer' THEN 'Transferência'
-                ELSE t.transaction_type
-            END as transaction_type_pt,
-            t.description,
-            t.created_at,
-            date(t.created_at) as transaction_date,
-            strftime('%Y-%m', t.created_at) as year_month,
-            strftime('%Y', t.created_at) as year,
-            strftime('%m', t.created_at) as month,
-            strftime('%d', t.created_at) as day,
-            strftime('%w', t.created_at) as weekday,
-            CASE strftime('%w', t.created_at)
-                WHEN '0' THEN 'Domingo'
-                WHEN '1' THEN 'Segunda'
-                WHEN '2' THEN 'Terça'
-                WHEN '3' THEN 'Quarta'
-                WHEN '4' THEN 'Quinta'
-                WHEN '5' THEN 'Sexta'
-                WHEN '6' THEN 'Sábado'
-            END as weekday_name,
-            CASE 
-                WHEN CAST(t.amount AS REAL) >= 1000 THEN 'Grande'
-                WHEN CAST(t.amount AS REAL) >= 100 THEN 'Média'
-                ELSE 'Pequena'
-            END as amount_category
-        FROM transactions t
-        LEFT JOIN accounts fa ON t.from_account_id = fa.id
-        LEFT JOIN accounts ta ON t.to_account_id = ta.id
-        ORDER BY t.created_at DESC
-        """
-        
-        transactions_df = pd.read_sql_query(transactions_query, db.connection)
-        
-        # Converter datas para formato adequado
-        transactions_df['created_at'] = pd.to_datetime(transactions_df['created_at'])
-        transactions_df['transaction_date'] = pd.to_datetime(transactions_df['transaction_date'])
+        # Os nomes vêm do frame de contas já carregado, mapeados por id
+        account_names = accounts_df.set_index('id')['account_name']
         
-        transactions_df.to_csv(f'{output_dir}/transactions.csv', index=False, encoding='utf-8-sig')
-        transactions_df.to_excel(f'{output_dir}/transactions.xlsx', index=False)
-        
-        print(f"    ✅ {len(transactions_df)} transações exportadas")
+        # Transmitida em blocos: cada bloco é enriquecido, anexado ao CSV e
+        # escrito no workbook em modo write-only, mantendo em memória apenas
+        # um bloco por vez em vez da tabela inteira mais o workbook
+        transactions_csv = f'{output_dir}/transactions.csv'
+        workbook = worksheet = None
+        if 'xlsx' in formats:
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Sheet1')
+            worksheet.append(TRANSACTIONS_COLUMNS)
+        parquet_writer = None
+
+        # Agregados parciais por bloco; combinados depois do loop, eles
+        # substituem as três consultas que revarriam a tabela inteira
+        # (resumo mensal, fluxo de caixa e KPIs)
+        monthly_parts = []
+        cashflow_parts = []
+        amount_sum = 0.0
+        today_count = 0
+        month_count = 0
+        # date('now') do SQLite é UTC; os contadores usam o mesmo relógio
+        utc_now = datetime.now(timezone.utc)
+        today_ts = pd.Timestamp(utc_now.strftime('%Y-%m-%d'))
+        current_month = utc_now.strftime('%Y-%m')
+
+        transactions_count = 0
+        first_chunk = True
+        for chunk in pd.read_sql_query(_TRANSACTIONS_SQL, db.connection,
+                                       chunksize=TRANSACTIONS_CHUNK_ROWS):
+            chunk = _enrich_transactions(chunk, account_names)
+
+            monthly_parts.append(chunk.groupby(
+                ['year_month', 'year', 'month', 'transaction_type'],
+                as_index=False).agg(
+                    transaction_count=('amount_numeric', 'size'),
+                    total_amount=('amount_numeric', 'sum'),
+                    min_amount=('amount_numeric', 'min'),
+                    max_amount=('amount_numeric', 'max')))
+
+            flow = chunk[chunk['transaction_type'].isin(('deposit', 'withdrawal'))]
+            if len(flow):
+                is_deposit = flow['transaction_type'] == 'deposit'
+                cashflow_parts.append(flow.assign(
+                    inflow=flow['amount_numeric'].where(is_deposit, 0.0),
+                    outflow=flow['amount_numeric'].where(~is_deposit, 0.0),
+                ).groupby('transaction_date', as_index=False).agg(
+                    inflow=('inflow', 'sum'),
+                    outflow=('outflow', 'sum'),
+                    total_transactions=('inflow', 'size')))
+
+            amount_sum += chunk['amount_numeric'].sum()
+            today_count += int((chunk['transaction_date'] == today_ts).sum())
+            month_count += int((chunk['year_month'] == current_month).sum())
+            if 'csv' in formats:
+                chunk.to_csv(transactions_csv, mode='w' if first_chunk else 'a',
+                             header=first_chunk, index=False, encoding='utf-8-sig')
+            if 'parquet' in formats:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(
+                        f'{output_dir}/transactions.parquet',
+                        table.schema, compression='zstd')
+                parquet_writer.write_table(table)
+            if worksheet is not None:
+                for row in chunk.itertuples(index=False):
+                    worksheet.append(list(row))
+            transactions_count += len(chunk)
+            first_chunk = False
+
+        if parquet_writer is not None:
+            parquet_writer.close()
+        if workbook is not None:
+            workbook.save(f'{output_dir}/transactions.xlsx')
+
+        print(f"    ✅ {transactions_count} transações exportadas")
         
         # 3. RESUMO MENSAL
         print("  📊 Criando resumo mensal...")
-        monthly_summary_query = """
-        SELECT 
-            strftime('%Y-%m', created_at) as year_month,
-            strftime('%Y', created_at) as year,
-            strftime('%m', created_at) as month,
-            transaction_type,
-            CASE 
-                WHEN transaction_type = 'deposit' THEN 'Depósito'
-                WHEN transaction_type = 'withdrawal' THEN 'Saque'
-                WHEN transaction_type = 'transfer' THEN 'Transferência'
-                ELSE transaction_type
-            END as transaction_type_pt,
-            COUNT(*) as transaction_count,
-            SUM(CAST(amount AS REAL)) as total_amount,
-            AVG(CAST(amount AS REAL)) as avg_amount,
-            MIN(CAST(amount AS REAL)) as min_amount,
-            MAX(CAST(amount AS REAL)) as max_amount
-        FROM transactions
-        GROUP BY strftime('%Y-%m', created_at), transaction_type
-        ORDER BY year_month, transaction_type
-        """
-        
-        monthly_df = pd.read_sql_query(monthly_summary_query, db.connection)
-        monthly_df.to_csv(f'{output_dir}/monthly_summary.csv', index=False, encoding='utf-8-sig')
-        monthly_df.to_excel(f'{output_dir}/monthly_summary.xlsx', index=False)
+        # Combina os agregados parciais dos blocos; a média sai de
+        # soma/contagem totais, então agregar por partes não a distorce
+        if monthly_parts:
+            monthly_df = (pd.concat(monthly_parts, ignore_index=True)
+                          .groupby(['year_month', 'year', 'month', 'transaction_type'],
+                                   as_index=False)
+                          .agg(transaction_count=('transaction_count', 'sum'),
+                               total_amount=('total_amount', 'sum'),
+                               min_amount=('min_amount', 'min'),
+                               max_amount=('max_amount', 'max')))
+            monthly_df['avg_amount'] = (
+                monthly_df['total_amount'] / monthly_df['transaction_count'])
+            monthly_df = monthly_df.sort_values(
+                ['year_month', 'transaction_type'], ignore_index=True)
+        else:
+            monthly_df = pd.DataFrame(columns=[
+                'year_month', 'year', 'month', 'transaction_type',
+                'transaction_count', 'total_amount', 'min_amount',
+                'max_amount', 'avg_amount'])
+        monthly_df['transaction_type_pt'] = (
+            monthly_df['transaction_type'].map(TRANSACTION_TYPE_PT)
+            .fillna(monthly_df['transaction_type']))
+        monthly_df = monthly_df[[
+            'year_month', 'year', 'month', 'transaction_type',
+            'transaction_count', 'total_amount', 'avg_amount',
+            'min_amount', 'max_amount', 'transaction_type_pt']]
+        futures += _write_table(monthly_df, output_dir, 'monthly_summary',
+                                formats, pool)
         
         print(f"    ✅ {len(monthly_df)} registros de resumo mensal")
         
         # 4. ANÁLISE DE FLUXO DE CAIXA
         print("  💹 Criando análise de fluxo...")
-        cashflow_query = """
-        SELECT 
-            date(created_at) as date,
-            SUM(CASE WHEN transaction_type = 'deposit' THEN CAST(amount AS REAL) ELSE 0 END) as inflow,
-            SUM(CASE WHEN transaction_type = 'withdrawal' THEN CAST(amount AS REAL) ELSE 0 END) as outflow,
-            SUM(CASE WHEN transaction_type = 'deposit' THEN CAST(amount AS REAL) ELSE 0 END) - 
-            SUM(CASE WHEN transaction_type = 'withdrawal' THEN CAST(amount AS REAL) ELSE 0 END) as net_flow,
-            COUNT(*) as total_transactions
-        FROM transactions
-        WHERE transaction_type IN ('deposit', 'withdrawal')
-        GROUP BY date(created_at)
-        ORDER BY date
-        """
-        
-        cashflow_df = pd.read_sql_query(cashflow_query, db.connection)
-        cashflow_df['date'] = pd.to_datetime(cashflow_df['date'])
-        cashflow_df.to_csv(f'{output_dir}/cashflow_analysis.csv', index=False, encoding='utf-8-sig')
+        if cashflow_parts:
+            cashflow_df = (pd.concat(cashflow_parts, ignore_index=True)
+                           .groupby('transaction_date', as_index=False)
+                           .agg(inflow=('inflow', 'sum'),
+                                outflow=('outflow', 'sum'),
+                                total_transactions=('total_transactions', 'sum'))
+                           .rename(columns={'transaction_date': 'date'}))
+            cashflow_df['net_flow'] = cashflow_df['inflow'] - cashflow_df['outflow']
+            cashflow_df = cashflow_df[[
+                'date', 'inflow', 'outflow', 'net_flow',
+                'total_transactions']].sort_values('date', ignore_index=True)
+        else:
+            cashflow_df = pd.DataFrame(columns=[
+                'date', 'inflow', 'outflow', 'net_flow', 'total_transactions'])
+        # Tabelas analíticas pequenas: sem planilha Excel, como antes
+        futures += _write_table(cashflow_df, output_dir, 'cashflow_analysis',
+                                tuple(f for f in formats if f != 'xlsx'), pool)
         
         # 5. KPIs PARA DASHBOARD
         print("  📈 Gerando KPIs...")
-        kpis_query = """
-        SELECT 
-            (SELECT COUNT(*) FROM accounts) as total_accounts,
-            (SELECT SUM(CAST(balance AS REAL)) FROM accounts) as total_balance,
-            (SELECT COUNT(*) FROM transactions) as total_transactions,
-            (SELECT COUNT(*) FROM transactions WHERE date(created_at) = date('now')) as today_transactions,
-            (SELECT COUNT(*) FROM transactions WHERE strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')) as month_transactions,
-            (SELECT AVG(CAST(balance AS REAL)) FROM accounts) as avg_balance,
-            (SELECT AVG(CAST(amount AS REAL)) FROM transactions) as avg_transaction_amount
-        """
-        
-        kpis_df = pd.read_sql_query(kpis_query, db.connection)
-        kpis_df.to_csv(f'{output_dir}/kpis.csv', index=False, encoding='utf-8-sig')
+        # Tudo já está em memória: contas no accounts_df, transações nos
+        # acumuladores do loop — nenhuma consulta extra ao banco
+        kpis_df = pd.DataFrame([{
+            'total_accounts': len(accounts_df),
+            'total_balance': accounts_df['balance_numeric'].sum(),
+            'total_transactions': transactions_count,
+            'today_transactions': today_count,
+            'month_transactions': month_count,
+            'avg_balance': accounts_df['balance_numeric'].mean(),
+            'avg_transaction_amount': (
+                amount_sum / transactions_count if transactions_count else None),
+        }])
+        futures += _write_table(kpis_df, output_dir, 'kpis',
+                                tuple(f for f in formats if f != 'xlsx'), pool)
         
         # 6. CRIAR ARQUIVO DE CONEXÃO PARA POWER BI
-        connection_info = f"""
-# Informações de Conexão Power BI - CoreLedger
-# Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Arquivos Exportados:
-- accounts.csv / accounts.xlsx          - Dados das contas
-- transactions.csv / transactions.xlsx  - Dados das transações  
-- monthly_summary.csv / monthly_summary.xlsx - Resumo mensal
-- cashflow_analysis.csv                 - Análise de fluxo de caixa
-- kpis.csv                             - Indicadores principais
-
-## Para Power BI Desktop:
-1. Obter Dados → Texto/CSV
-2. Selecione os arquivos CSV desta pasta
-3. Configure relacionamentos:
-   - accounts[id] ↔ transactions[from_account_id]
-   - accounts[id] ↔ transactions[to_account_id]
-
-## Para conexão direta SQLite:
-1. Obter Dados → SQLite
-2. Selecione: {os.path.abspath(db_path)}
-3. Importe tabelas: accounts, transactions
-
-## Campos Principais:
-- Contas: id, account_name, balance_numeric, balance_category
-- Transações: amount_numeric, transaction_type_pt, transaction_date
-- Datas: Use 'transaction_date' para eixos temporais
-"""
+        connection_info = _CONNECTION_INFO_TEMPLATE.substitute(
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            formats=', '.join(formats),
+            db_path=os.path.abspath(db_path),
+        )
         
         with open(f'{output_dir}/POWERBI_CONNECTION_INFO.txt', 'w', encoding='utf-8') as f:
             f.write(connection_info)
         
+        # Propaga qualquer erro das escritas em background antes do resumo
+        for future in futures:
+            future.result()
+        
         print(f"\n🎉 Exportação concluída com sucesso!")
         print(f"📁 Arquivos salvos em: {os.path.abspath(output_dir)}")
         print(f"📊 Total de dados exportados:")
         print(f"   - {len(accounts_df)} contas")
-        print(f"   - {len(transactions_df)} transações")
+        print(f"   - {transactions_count} transações")
         print(f"   - {len(monthly_df)} registros mensais")
         print(f"   - {len(cashflow_df)} registros de fluxo")
         
         print(f"\n💡 Próximos passos:")
         print(f"   1. Abra o Power BI Desktop")
-        print(f"   2. Importe os arquivos .csv ou .xlsx da pasta '{output_dir}'")
+        print(f"   2. Importe os arquivos ({', '.join(formats)}) da pasta '{output_dir}'")
         print(f"   3. Configure relacionamentos entre tabelas")
         print(f"   4. Crie suas visualizações!")
         
@@ -239,6 +412,7 @@ def export_data_for_powerbi(db_path="multilingual_bank.db", output_dir="powerbi_
         traceback.print_exc()
     
     finally:
+        pool.shutdown(wait=True)
         db.close()
 
 
@@ -257,37 +431,34 @@ def show_sample_data():
         print("📊 AMOSTRA DOS DADOS DISPONÍVEIS")
         print("=" * 50)
         
-        # Contas
-        cursor.execute("SELECT COUNT(*) FROM accounts")
-        accounts_count = cursor.fetchone()[0]
+        # Os dois COUNTs saem em uma única ida ao SQLite em vez de duas
+        accounts_count, transactions_count = cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM accounts),
+                   (SELECT COUNT(*) FROM transactions)
+        """).fetchone()
+
+        # Contas — iterando o cursor diretamente, sem materializar fetchall
         print(f"\n👥 CONTAS ({accounts_count} registros):")
-        
-        cursor.execute("SELECT id, name, balance FROM accounts LIMIT 3")
-        for row in cursor.fetchall():
+        for row in cursor.execute("SELECT id, name, balance FROM accounts LIMIT 3"):
             print(f"   ID: {row[0]} | Nome: {row[1]} | Saldo: R$ {row[2]}")
         
         # Transações
-        cursor.execute("SELECT COUNT(*) FROM transactions")
-        transactions_count = cursor.fetchone()[0]
         print(f"\n💰 TRANSAÇÕES ({transactions_count} registros):")
-        
-        cursor.execute("""
+        for row in cursor.execute("""
             SELECT transaction_type, amount, created_at 
             FROM transactions 
             ORDER BY created_at DESC 
             LIMIT 3
-        """)
-        for row in cursor.fetchall():
+        """):
             print(f"   Tipo: {row[0]} | Valor: R$ {row[1]} | Data: {row[2]}")
         
         # Resumo por tipo
         print(f"\n📈 RESUMO POR TIPO:")
-        cursor.execute("""
+        for row in cursor.execute("""
             SELECT transaction_type, COUNT(*), SUM(CAST(amount AS REAL))
             FROM transactions 
             GROUP BY transaction_type
-        """)
-        for row in cursor.fetchall():
+        """):
             print(f"   {row[0]}: {row[1]} transações, Total: R$ {row[2]:.2f}")
         
     finally:
@@ -295,9 +466,16 @@ def show_sample_data():
 
 
 if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1 and sys.argv[1] == "--sample":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exporta dados para Power BI")
+    parser.add_argument("--sample", action="store_true",
+                        help="Mostra uma amostra dos dados em vez de exportar")
+    parser.add_argument("--format", default=",".join(DEFAULT_FORMATS),
+                        help="Formatos de saída separados por vírgula: csv, parquet, xlsx")
+    args = parser.parse_args()
+
+    if args.sample:
         show_sample_data()
     else:
-        export_data_for_powerbi()
\ No newline at end of file
+        export_data_for_powerbi(formats=args.format.split(","))
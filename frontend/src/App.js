@@ -1,5 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import axios from 'axios';
+import { decode } from '@msgpack/msgpack';
 import {
   AreaChart,
   Area,
@@ -23,6 +24,78 @@ const WS_URL = 'ws://localhost:8000/ws';
 // Color palette
 const COLORS = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c', '#9b59b6', '#1abc9c'];
 
+// Fold a per-transaction "tx" delta frame into the current snapshot.
+// The server only sends a full dashboard_update on connect (and for
+// account-level changes); each deposit/withdrawal/transfer arrives as a
+// small delta carrying the transaction and the affected balances in cents.
+const applyTxDelta = (prev, tx, balances) => {
+  if (!prev) {
+    // No snapshot yet to fold into; the connect-time snapshot is on its way
+    return prev;
+  }
+
+  const accounts = prev.charts.accounts.map((account) =>
+    balances[account.id] !== undefined
+      ? { ...account, balance: balances[account.id] / 100 }
+      : account
+  );
+  const nameById = {};
+  accounts.forEach((account) => {
+    nameById[account.id] = account.name;
+  });
+
+  const hasType = prev.charts.transaction_types.some(
+    (item) => item.type === tx.transaction_type
+  );
+  const transactionTypes = hasType
+    ? prev.charts.transaction_types.map((item) =>
+        item.type === tx.transaction_type
+          ? { ...item, count: item.count + 1 }
+          : item
+      )
+    : [...prev.charts.transaction_types, { type: tx.transaction_type, count: 1 }];
+
+  const recentTransactions = [
+    {
+      id: tx.id,
+      from_account_id: tx.from_account_id,
+      to_account_id: tx.to_account_id,
+      amount: tx.amount,
+      type: tx.transaction_type,
+      description: tx.description,
+      created_at: new Date().toISOString(),
+      from_name: tx.from_account_id != null ? nameById[tx.from_account_id] : null,
+      to_name: tx.to_account_id != null ? nameById[tx.to_account_id] : null
+    },
+    ...prev.charts.recent_transactions
+  ].slice(0, 10);
+
+  // Transfers move money between accounts; only deposits and
+  // withdrawals change the system-wide total
+  let totalBalance = prev.kpis.total_balance;
+  if (tx.transaction_type === 'deposit') {
+    totalBalance += tx.amount;
+  } else if (tx.transaction_type === 'withdrawal') {
+    totalBalance -= tx.amount;
+  }
+
+  return {
+    ...prev,
+    kpis: {
+      ...prev.kpis,
+      total_balance: totalBalance,
+      today_transactions: prev.kpis.today_transactions + 1,
+      month_transactions: prev.kpis.month_transactions + 1
+    },
+    charts: {
+      ...prev.charts,
+      accounts,
+      transaction_types: transactionTypes,
+      recent_transactions: recentTransactions
+    }
+  };
+};
+
 function App() {
   const [dashboardData, setDashboardData] = useState(null);
   const [wsConnected, setWsConnected] = useState(false);
@@ -55,12 +128,20 @@ function App() {
         setWs(websocket);
       };
 
+      websocket.binaryType = 'arraybuffer';
+
       websocket.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data);
+          // Server sends MessagePack binary frames (JSON kept as a
+          // fallback for plain text frames)
+          const data = typeof event.data === 'string'
+            ? JSON.parse(event.data)
+            : decode(new Uint8Array(event.data));
           if (data.type === 'dashboard_update') {
             setDashboardData(data.data);
             setLoading(false);
+          } else if (data.type === 'tx') {
+            setDashboardData((prev) => applyTxDelta(prev, data.tx, data.balances));
           }
         } catch (error) {
           console.error('Error parsing WebSocket message:', error);
@@ -7,17 +7,36 @@ allowing users to select their preferred language at startup.
 
 import sys
 import os
-import json
 import atexit
+import asyncio
 from decimal import Decimal, InvalidOperation
 from typing import Dict, List, Optional
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import orjson
 
-from ledger import BankLedger, AccountNotFoundError, LedgerError
-from models.account import InsufficientFundsError, InvalidAmountError
-from i18n import _, select_language_interactive, get_language_manager
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.patch_stdout import patch_stdout
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
+
+from src.i18n import _, select_language_interactive, get_language_manager
+
+# Separator lines built once at import instead of "=" * 40 per print
+_EQ40 = "=" * 40
+_EQ60 = "=" * 60
+_DASH40 = "-" * 40
+
+# Hot Decimal constants parsed once at import rather than per input
+_ZERO = Decimal("0")
+_DEFAULT_ZERO = Decimal("0.00")
+
+# Base yes/no vocabularies shared by every language; confirm_action adds
+# the current language's translated words on top once per run
+_YES_RESPONSES = frozenset({'s', 'sim', 'y', 'yes', 'si', 'sí', 'oui', 'ja', 'はい', '是'})
+_NO_RESPONSES = frozenset({'n', 'não', 'nao', 'no', 'non', 'nein', 'いいえ', '否'})
 
 
 class MultilingualBankCLI:
@@ -29,32 +48,89 @@ class MultilingualBankCLI:
         self.ledger = None
         self.running = True
         self.lang_manager = get_language_manager()
+
+        # One PromptSession for the whole run: terminal setup happens once
+        # and we get history plus completion for the menu inputs. Falls
+        # back to plain input() when prompt_toolkit is missing or stdin
+        # is not a terminal (piped/CI runs).
+        if PROMPT_TOOLKIT_AVAILABLE and sys.stdin.isatty():
+            self._session = PromptSession(completer=WordCompleter(
+                ['1', '2', '3', '4', '5', '6', '7', '8', '9', 'c', 'y', 'n']))
+        else:
+            self._session = None
+
+        # Rendered lazily by show_main_menu once the language is known
+        self._main_menu: Optional[str] = None
+        # Translated lazily by format_transaction_type, same reason
+        self._txn_labels: Optional[Dict] = None
+        # Built lazily by confirm_action for the chosen language
+        self._yes_set: Optional[frozenset] = None
+        self._no_set: Optional[frozenset] = None
+        self._fast_confirm: Dict[str, bool] = {}
+        # Refreshed by select_startup_language once the language is set;
+        # read per displayed amount by format_currency/get_decimal_input
+        self._currency_fmt = _('currency_format')
+        self._currency_symbol = _('currency_symbol')
+
+        # Menu dispatch bound once; choices '1'-'9' index straight into it
+        self._menu_actions = (
+            self.create_account,
+            self.make_deposit,
+            self.make_withdrawal,
+            self.transfer_money,
+            self.view_account_details,
+            self.view_all_accounts,
+            self.view_transaction_history,
+            self.delete_account,
+            self.exit_application,
+        )
         
         # Registrar função de auto-delete da configuração de idioma
         atexit.register(self.auto_delete_language_config)
         
-    def start(self):
+    async def start(self):
         """Start the interactive CLI session with language selection."""
         # Language selection at startup
         self.select_startup_language()
         
+        # Imported here, after the picker: the user sees the language
+        # prompt without waiting for the ledger stack (sqlite3 and the
+        # model modules) to load
+        from src.ledger import BankLedger
+        
         # Initialize ledger
         self.ledger = BankLedger(self.db_path)
         
+        # Fetch the summary numbers in the background so the banner
+        # prints while the DB round-trips run. Both reads happen in one
+        # worker thread (they share the SQLite connection) and prime the
+        # ledger's memoized caches for the first menu action.
+        def _load_summary():
+            accounts = self.ledger.list_accounts()
+            return len(accounts), self.ledger.get_total_system_balance()
+        summary_task = asyncio.create_task(asyncio.to_thread(_load_summary))
+        
         # Welcome message
-        print("=" * 60)
+        print(_EQ60)
         print(f"🏦 {_('app_welcome')}")
-        print("=" * 60)
+        print(_EQ60)
         print(_('summary_database', path=self.db_path))
-        print(_('summary_accounts', count=len(self.ledger.list_accounts())))
-        print(_('summary_balance', balance=self.format_currency(self.ledger.get_total_system_balance())))
+        account_count, total_balance = await summary_task
+        print(_('summary_accounts', count=account_count))
+        print(_('summary_balance', balance=self.format_currency(total_balance)))
         print()
         
+        if sys.stdout.isatty():
+            # Block-buffer stdout for the REPL: bursts of prints between
+            # prompts coalesce into the single flush get_user_input does
+            # at the prompt boundary, instead of one write per line
+            sys.stdout.reconfigure(line_buffering=False)
+        
         try:
             while self.running:
                 self.show_main_menu()
-                choice = self.get_user_input(_('menu_select')).strip()
-                self.handle_main_menu_choice(choice)
+                choice = (await self.get_user_input(_('menu_select'))).strip()
+                await self.handle_main_menu_choice(choice)
         except KeyboardInterrupt:
             print(f"\n\n👋 {_('app_goodbye')}")
         except Exception as e:
@@ -71,8 +147,9 @@ class MultilingualBankCLI:
         
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                # orjson parses straight from bytes, same as the API layer
+                with open(config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
                     saved_language = config.get('language')
         except:
             pass
@@ -84,78 +161,75 @@ class MultilingualBankCLI:
             # Save language preference
             try:
                 config = {'language': selected_language}
-                with open(config_file, 'w', encoding='utf-8') as f:
-                    json.dump(config, f)
+                with open(config_file, 'wb') as f:
+                    f.write(orjson.dumps(config))
             except:
                 pass  # Continue without saving if there's an error
         else:
             # Use saved language
             self.lang_manager.set_language(saved_language)
             print(f"🌍 {_('lang_selected', language=self.lang_manager.get_language_name())}")
+        
+        # Resolve the currency strings once for the chosen language
+        self._currency_fmt = _('currency_format')
+        self._currency_symbol = _('currency_symbol')
     
     def format_currency(self, amount: Decimal) -> str:
         """Format currency according to current language settings."""
-        currency_format = _('currency_format')
         try:
-            return currency_format.format(amount=amount)
+            return self._currency_fmt.format(amount=amount)
         except:
             return f"${amount}"  # Fallback
     
     def show_main_menu(self):
         """Display the main menu options."""
-        print("\n" + "=" * 40)
-        print(f"📋 {_('menu_title')}")
-        print("=" * 40)
-        print(f"1. 👤 {_('menu_create_account')}")
-        print(f"2. 💰 {_('menu_deposit')}")
-        print(f"3. 💸 {_('menu_withdraw')}")
-        print(f"4. 🔄 {_('menu_transfer')}")
-        print(f"5. 💳 {_('menu_view_account')}")
-        print(f"6. 📊 {_('menu_view_all')}")
-        print(f"7. 📜 {_('menu_history')}")
-        print(f"8. 🗑️  {_('menu_delete')}")
-        print(f"9. 🚪 {_('menu_exit')}")
-        print("-" * 40)
+        if self._main_menu is None:
+            # The language is fixed after startup selection, so the banner
+            # is invariant for the run: translate and join it once, then
+            # every refresh is a single stdout write instead of 12 prints.
+            self._main_menu = "\n".join((
+                "\n" + _EQ40,
+                f"📋 {_('menu_title')}",
+                _EQ40,
+                f"1. 👤 {_('menu_create_account')}",
+                f"2. 💰 {_('menu_deposit')}",
+                f"3. 💸 {_('menu_withdraw')}",
+                f"4. 🔄 {_('menu_transfer')}",
+                f"5. 💳 {_('menu_view_account')}",
+                f"6. 📊 {_('menu_view_all')}",
+                f"7. 📜 {_('menu_history')}",
+                f"8. 🗑️  {_('menu_delete')}",
+                f"9. 🚪 {_('menu_exit')}",
+                _DASH40,
+            )) + "\n"
+        sys.stdout.write(self._main_menu)
+        sys.stdout.flush()
     
-    def handle_main_menu_choice(self, choice: str):
+    async def handle_main_menu_choice(self, choice: str):
         """Handle user's main menu selection."""
-        menu_actions = {
-            '1': self.create_account,
-            '2': self.make_deposit,
-            '3': self.make_withdrawal,
-            '4': self.transfer_money,
-            '5': self.view_account_details,
-            '6': self.view_all_accounts,
-            '7': self.view_transaction_history,
-            '8': self.delete_account,
-            '9': self.exit_application,
-        }
-        
-        if choice in menu_actions:
-            menu_actions[choice]()
+        if len(choice) == 1 and '1' <= choice <= '9':
+            await self._menu_actions[ord(choice) - ord('1')]()
         else:
             print(f"❌ {_('menu_invalid')}")
     
-    def create_account(self):
+    async def create_account(self):
         """Handle account creation."""
-        print("\n" + "=" * 40)
-        print(f"👤 {_('create_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n👤 {_('create_title')}\n{_EQ40}")
         
         # Get account name
         while True:
-            name = self.get_user_input(_('create_name_prompt')).strip()
+            name = (await self.get_user_input(_('create_name_prompt'))).strip()
             if name:
                 break
             print(f"❌ {_('create_name_empty')}")
         
         # Get initial balance
-        initial_balance = self.get_decimal_input(_('create_balance_prompt'), default="0.00")
+        initial_balance = await self.get_decimal_input(_('create_balance_prompt'), default=_DEFAULT_ZERO)
         if initial_balance is None:
             return
         
         try:
-            account_id = self.ledger.create_account(name, str(initial_balance))
+            account_id = self.ledger.create_account(name, initial_balance)
             print(f"✅ {_('create_success')}")
             print(f"   {_('create_account_id', id=account_id)}")
             print(f"   {_('create_account_name', name=name)}")
@@ -169,25 +243,23 @@ class MultilingualBankCLI:
         except Exception as e:
             print(f"❌ {_('error_unexpected', error=str(e))}")
     
-    def make_deposit(self):
+    async def make_deposit(self):
         """Handle deposit operations."""
-        print("\n" + "=" * 40)
-        print(f"💰 {_('deposit_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n💰 {_('deposit_title')}\n{_EQ40}")
         
-        account = self.select_account()
+        account = await self.select_account()
         if not account:
             return
         
-        amount = self.get_decimal_input(_('deposit_amount_prompt'))
+        amount = await self.get_decimal_input(_('deposit_amount_prompt'))
         if amount is None or amount <= 0:
             print(f"❌ {_('deposit_invalid_amount')}")
             return
         
-        description = self.get_user_input(_('deposit_description_prompt')).strip()
+        description = (await self.get_user_input(_('deposit_description_prompt'))).strip()
         
         try:
-            new_balance = self.ledger.deposit(account.id, str(amount), description)
+            new_balance = self.ledger.deposit(account.id, amount, description)
             print(f"✅ {_('deposit_success')}")
             print(f"   {_('deposit_amount', amount=amount)}")
             print(f"   {_('deposit_new_balance', balance=new_balance)}")
@@ -195,19 +267,19 @@ class MultilingualBankCLI:
         except Exception as e:
             print(f"❌ {_('app_error')}: {e}")
     
-    def make_withdrawal(self):
+    async def make_withdrawal(self):
         """Handle withdrawal operations."""
-        print("\n" + "=" * 40)
-        print(f"💸 {_('withdraw_title')}")
-        print("=" * 40)
+        from src.models.account import InsufficientFundsError
         
-        account = self.select_account()
+        print(f"\n{_EQ40}\n💸 {_('withdraw_title')}\n{_EQ40}")
+        
+        account = await self.select_account()
         if not account:
             return
         
         print(f"{_('withdraw_current_balance', balance=account.balance)}")
         
-        amount = self.get_decimal_input(_('withdraw_amount_prompt'))
+        amount = await self.get_decimal_input(_('withdraw_amount_prompt'))
         if amount is None or amount <= 0:
             print(f"❌ {_('withdraw_invalid_amount')}")
             return
@@ -216,10 +288,10 @@ class MultilingualBankCLI:
             print(f"❌ {_('withdraw_insufficient', available=account.balance)}")
             return
         
-        description = self.get_user_input(_('withdraw_description_prompt')).strip()
+        description = (await self.get_user_input(_('withdraw_description_prompt'))).strip()
         
         try:
-            new_balance = self.ledger.withdraw(account.id, str(amount), description)
+            new_balance = self.ledger.withdraw(account.id, amount, description)
             print(f"✅ {_('withdraw_success')}")
             print(f"   {_('withdraw_amount', amount=amount)}")
             print(f"   {_('withdraw_new_balance', balance=new_balance)}")
@@ -229,20 +301,18 @@ class MultilingualBankCLI:
         except Exception as e:
             print(f"❌ {_('app_error')}: {e}")
     
-    def transfer_money(self):
+    async def transfer_money(self):
         """Handle money transfer operations."""
-        print("\n" + "=" * 40)
-        print(f"🔄 {_('transfer_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n🔄 {_('transfer_title')}\n{_EQ40}")
         
         print(_('transfer_from'))
-        from_account = self.select_account()
+        from_account = await self.select_account()
         if not from_account:
             return
         
         print(f"\n{_('transfer_from_account', name=from_account.name, balance=from_account.balance)}")
         print(_('transfer_to'))
-        to_account = self.select_account(exclude_id=from_account.id)
+        to_account = await self.select_account(exclude_id=from_account.id)
         if not to_account:
             return
         
@@ -250,7 +320,7 @@ class MultilingualBankCLI:
         print(f"{_('transfer_from_account', name=from_account.name, balance=from_account.balance)}")
         print(f"{_('transfer_to_account', name=to_account.name, balance=to_account.balance)}")
         
-        amount = self.get_decimal_input(_('transfer_amount_prompt'))
+        amount = await self.get_decimal_input(_('transfer_amount_prompt'))
         if amount is None or amount <= 0:
             print(f"❌ {_('deposit_invalid_amount')}")
             return
@@ -259,7 +329,7 @@ class MultilingualBankCLI:
             print(f"❌ {_('transfer_insufficient', available=from_account.balance)}")
             return
         
-        description = self.get_user_input(_('transfer_description_prompt')).strip()
+        description = (await self.get_user_input(_('transfer_description_prompt'))).strip()
         
         # Confirm transfer
         print(f"\n📋 {_('transfer_summary')}")
@@ -268,13 +338,13 @@ class MultilingualBankCLI:
         print(f"   {_('deposit_amount', amount=amount)}")
         print(f"   Description: {description or _('details_no_transactions')}")
         
-        if not self.confirm_action(_('transfer_confirm')):
+        if not await self.confirm_action(_('transfer_confirm')):
             print(f"❌ {_('transfer_cancelled')}")
             return
         
         try:
             from_balance, to_balance = self.ledger.transfer(
-                from_account.id, to_account.id, str(amount), description
+                from_account.id, to_account.id, amount, description
             )
             print(f"✅ {_('transfer_success')}")
             print(f"   {from_account.name}: {self.format_currency(from_balance)}")
@@ -283,13 +353,11 @@ class MultilingualBankCLI:
         except Exception as e:
             print(f"❌ {_('app_error')}: {e}")
     
-    def view_account_details(self):
+    async def view_account_details(self):
         """Display detailed account information."""
-        print("\n" + "=" * 40)
-        print(f"💳 {_('details_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n💳 {_('details_title')}\n{_EQ40}")
         
-        account = self.select_account()
+        account = await self.select_account()
         if not account:
             return
         
@@ -300,77 +368,100 @@ class MultilingualBankCLI:
         if account.created_at:
             print(f"   {_('details_created', date=account.created_at.strftime('%Y-%m-%d %H:%M:%S'))}")
         
-        # Show recent transactions
-        transactions = self.ledger.get_account_transactions(account.id)
+        # Show recent transactions (only the five newest leave the DB)
+        transactions = self.ledger.get_account_transactions(account.id, limit=5)
         if transactions:
             print(f"\n📜 {_('details_transactions')}")
-            for i, txn in enumerate(transactions[:5], 1):
+            for i, txn in enumerate(transactions, 1):
                 txn_type = self.format_transaction_type(txn, account.id)
                 print(f"   {i}. {txn_type}: {self.format_currency(txn.amount)} - {txn.description}")
         else:
             print(f"\n📜 {_('details_no_transactions')}")
     
-    def view_all_accounts(self):
+    async def view_all_accounts(self):
         """Display all accounts in the system."""
-        print("\n" + "=" * 60)
-        print(f"📊 {_('all_accounts_title')}")
-        print("=" * 60)
+        print(f"\n{_EQ60}\n📊 {_('all_accounts_title')}\n{_EQ60}")
         
         accounts = self.ledger.list_accounts()
         if not accounts:
             print(_('all_accounts_empty'))
             return
         
-        total_balance = Decimal('0')
-        
-        print(f"{'ID':<4} {'Name':<25} {'Balance':<15} {'Created':<20}")
-        print("-" * 64)
-        
+        # Build the whole table and emit it in one stdout write: one lock
+        # and one syscall instead of one per account row
+        lines = [
+            f"{'ID':<4} {'Name':<25} {'Balance':<15} {'Created':<20}",
+            "-" * 64,
+        ]
         for account in accounts:
             created_str = account.created_at.strftime('%Y-%m-%d %H:%M') if account.created_at else 'Unknown'
             balance_str = self.format_currency(account.balance)
-            print(f"{account.id:<4} {account.name:<25} {balance_str:<15} {created_str:<20}")
-            total_balance += account.balance
-        
-        print("-" * 64)
-        print(f"{_('all_accounts_total'):<30} {self.format_currency(total_balance):<15}")
-        print(_('all_accounts_count', count=len(accounts)))
+            lines.append(f"{account.id:<4} {account.name:<25} {balance_str:<15} {created_str:<20}")
+
+        # The ledger memoizes the total (and the account list above), so
+        # this reads the cached sum instead of re-adding per row here
+        total_balance = self.ledger.get_total_system_balance()
+        lines.append("-" * 64)
+        lines.append(f"{_('all_accounts_total'):<30} {self.format_currency(total_balance):<15}")
+        lines.append(_('all_accounts_count', count=len(accounts)))
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def view_transaction_history(self):
+    async def view_transaction_history(self):
         """Display transaction history for an account."""
-        print("\n" + "=" * 40)
-        print(f"📜 {_('history_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n📜 {_('history_title')}\n{_EQ40}")
         
-        account = self.select_account()
+        account = await self.select_account()
         if not account:
             return
         
-        transactions = self.ledger.get_account_transactions(account.id)
-        if not transactions:
-            print(_('history_empty', name=account.name))
-            return
-        
-        print(f"\n📋 {_('history_for', name=account.name)}")
-        print(f"{'#':<3} {'Type':<12} {'Amount':<12} {'Description':<30}")
-        print("-" * 57)
-        
-        for i, txn in enumerate(transactions, 1):
-            txn_type = self.format_transaction_type(txn, account.id)
-            description = txn.description[:27] + "..." if len(txn.description) > 30 else txn.description
-            amount_str = self.format_currency(txn.amount)
-            print(f"{i:<3} {txn_type:<12} {amount_str:<12} {description:<30}")
-        
-        print(f"\n{_('history_total', count=len(transactions))}")
+        # Page through the history instead of materializing all of it:
+        # each page is one LIMIT/OFFSET query and one stdout write.
+        page_size = 20
+        page = 0
+        while True:
+            transactions = self.ledger.get_account_transactions(
+                account.id, limit=page_size, offset=page * page_size)
+            if not transactions:
+                if page == 0:
+                    print(_('history_empty', name=account.name))
+                return
+            
+            lines = [
+                f"\n📋 {_('history_for', name=account.name)}",
+                f"{'#':<3} {'Type':<12} {'Amount':<12} {'Description':<30}",
+                "-" * 57,
+            ]
+            # ljust on ready strings is a direct C call, skipping the
+            # per-field __format__ dispatch of width specs; account.id is
+            # hoisted so the label lookup doesn't reload it per row
+            account_id = account.id
+            for i, txn in enumerate(transactions, page * page_size + 1):
+                txn_type = self.format_transaction_type(txn, account_id)
+                description = txn.description[:27] + "..." if len(txn.description) > 30 else txn.description
+                amount_str = self.format_currency(txn.amount)
+                lines.append(str(i).ljust(3) + ' ' + txn_type.ljust(12) + ' '
+                             + amount_str.ljust(12) + ' ' + description.ljust(30))
+            lines.append(f"\n{_('history_total', count=len(transactions))}")
+            sys.stdout.write("\n".join(lines) + "\n")
+            
+            last_page = len(transactions) < page_size
+            if page == 0 and last_page:
+                return  # everything fit on one page; no need to prompt
+            print(f"\n{_('history_page', page=page + 1)}")
+            choice = (await self.get_user_input(_('history_page_prompt'))).strip().lower()
+            if choice == 'n' and not last_page:
+                page += 1
+            elif choice == 'p' and page > 0:
+                page -= 1
+            else:
+                return
     
-    def delete_account(self):
+    async def delete_account(self):
         """Handle account deletion."""
-        print("\n" + "=" * 40)
-        print(f"🗑️  {_('delete_title')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n🗑️  {_('delete_title')}\n{_EQ40}")
         print(f"⚠️  {_('delete_warning')}")
         
-        account = self.select_account()
+        account = await self.select_account()
         if not account:
             return
         
@@ -384,7 +475,7 @@ class MultilingualBankCLI:
         print(f"   {_('details_name', name=account.name)}")
         print(f"   {_('details_balance', balance=account.balance)}")
         
-        if not self.confirm_action(_('delete_confirm', name=account.name)):
+        if not await self.confirm_action(_('delete_confirm', name=account.name)):
             print(f"❌ {_('delete_cancelled')}")
             return
         
@@ -398,7 +489,7 @@ class MultilingualBankCLI:
         except Exception as e:
             print(f"❌ {_('app_error')}: {e}")
     
-    def select_account(self, exclude_id: Optional[int] = None) -> Optional[object]:
+    async def select_account(self, exclude_id: Optional[int] = None) -> Optional[object]:
         """Allow user to select an account from available accounts."""
         accounts = self.ledger.list_accounts()
         if exclude_id:
@@ -408,14 +499,19 @@ class MultilingualBankCLI:
             print(f"❌ {_('select_no_accounts')}")
             return None
         
-        print(f"\n{_('select_available')}")
+        # One joined write for the listing, as in the other table views;
+        # rows come from ''.join over ready pieces, which beats f-string
+        # assembly once the part count grows past a few
+        lines = ["\n" + _('select_available')]
         for i, account in enumerate(accounts, 1):
-            balance_str = self.format_currency(account.balance)
-            print(f"{i}. {account.name} (ID: {account.id}) - {balance_str}")
+            lines.append(''.join((str(i), '. ', account.name, ' (ID: ',
+                                  str(account.id), ') - ',
+                                  self.format_currency(account.balance))))
+        sys.stdout.write("\n".join(lines) + "\n")
         
         while True:
             try:
-                choice = self.get_user_input(_('select_prompt', count=len(accounts))).strip().lower()
+                choice = (await self.get_user_input(_('select_prompt', count=len(accounts)))).strip().lower()
                 
                 if choice == 'c':
                     return None
@@ -429,91 +525,117 @@ class MultilingualBankCLI:
             except ValueError:
                 print(f"❌ {_('select_invalid_input')}")
     
-    def get_decimal_input(self, prompt: str, default: str = None) -> Optional[Decimal]:
-        """Get decimal input from user with validation."""
+    async def get_decimal_input(self, prompt: str, default: Optional[Decimal] = None,
+                                _D=Decimal, _Inv=InvalidOperation) -> Optional[Decimal]:
+        """Get decimal input from user with validation.
+
+        ``default`` is a ready-made Decimal (not a string), so the default
+        costs nothing to return. ``_D``/``_Inv`` bind the hot names as
+        locals instead of per-iteration global lookups.
+        """
+        currency_symbol = self._currency_symbol
+        sym_len = len(currency_symbol)
         while True:
             try:
-                user_input = self.get_user_input(prompt).strip()
+                user_input = (await self.get_user_input(prompt)).strip()
                 
                 if not user_input and default is not None:
-                    return Decimal(default)
+                    return default
                 
                 if not user_input:
                     print(f"❌ {_('input_empty_amount')}")
                     continue
                 
-                # Remove currency symbols
-                currency_symbol = _('currency_symbol')
-                if user_input.startswith(currency_symbol):
-                    user_input = user_input[len(currency_symbol):]
-                elif user_input.startswith('$'):
+                # Remove currency symbols (prefix slice, not lstrip: the
+                # symbol can be multi-character like "R$ ")
+                if user_input[:sym_len] == currency_symbol:
+                    user_input = user_input[sym_len:]
+                elif user_input[0] == '$':
                     user_input = user_input[1:]
                 
-                amount = Decimal(user_input)
-                if amount < 0:
+                amount = _D(user_input)
+                if amount < _ZERO:
                     print(f"❌ {_('input_negative_amount')}")
                     continue
                 
                 return amount
                 
-            except InvalidOperation:
+            except _Inv:
                 print(f"❌ {_('input_invalid_amount')}")
             except KeyboardInterrupt:
                 return None
     
-    def get_user_input(self, prompt: str) -> str:
-        """Get input from user with consistent formatting."""
+    async def get_user_input(self, prompt: str) -> str:
+        """Get input from user with consistent formatting.
+
+        Uses the shared PromptSession when available (history, completion,
+        no per-call terminal setup); otherwise falls back to input() on a
+        worker thread so the event loop stays free.
+        """
         try:
-            return input(f"➤ {prompt}")
+            # Everything printed since the last prompt reaches the screen
+            # in one flush before the cursor parks on the input line
+            sys.stdout.flush()
+            if self._session is not None:
+                return await self._session.prompt_async(f"➤ {prompt}")
+            return await asyncio.to_thread(input, f"➤ {prompt}")
         except KeyboardInterrupt:
             print(f"\n\n{_('input_cancelled')}")
             raise
     
-    def confirm_action(self, message: str) -> bool:
+    async def confirm_action(self, message: str) -> bool:
         """Ask user for confirmation."""
-        while True:
-            # Get appropriate yes/no responses for current language
-            yes_responses = ['s', 'sim', 'y', 'yes', 'si', 'sí', 'oui', 'ja', 'はい', '是']
-            no_responses = ['n', 'não', 'nao', 'no', 'non', 'nein', 'いいえ', '否']
-            
-            # Add translated responses if available
+        if self._yes_set is None:
+            # Base vocabulary plus the current language's translated
+            # words, frozen once per run: each answer is then an O(1)
+            # set test instead of rebuilding two lists per iteration
             try:
-                yes_translated = _('app_yes').lower()
-                no_translated = _('app_no').lower()
-                if yes_translated not in yes_responses:
-                    yes_responses.append(yes_translated)
-                if no_translated not in no_responses:
-                    no_responses.append(no_translated)
+                self._yes_set = _YES_RESPONSES | {_('app_yes').lower()}
+                self._no_set = _NO_RESPONSES | {_('app_no').lower()}
             except:
-                pass  # Fallback if translation fails
-            
-            response = self.get_user_input(_('input_confirm_prompt', message=message)).strip().lower()
+                self._yes_set = _YES_RESPONSES  # Fallback if translation fails
+                self._no_set = _NO_RESPONSES
+            # Single-letter answers are the overwhelming majority; give
+            # them a one-lookup fast path derived from the same sets so
+            # the accepted vocabulary stays identical
+            self._fast_confirm = {r: True for r in self._yes_set if len(r) == 1}
+            self._fast_confirm.update(
+                {r: False for r in self._no_set if len(r) == 1})
+        
+        while True:
+            response = (await self.get_user_input(_('input_confirm_prompt', message=message))).strip().lower()
             
-            if response in yes_responses:
+            verdict = self._fast_confirm.get(response)
+            if verdict is not None:
+                return verdict
+            if response in self._yes_set:
                 return True
-            elif response in no_responses:
+            elif response in self._no_set:
                 return False
             else:
                 print(f"❌ {_('input_confirm_invalid')}")
     
     def format_transaction_type(self, transaction, account_id: int) -> str:
         """Format transaction type for display."""
-        if transaction.transaction_type == "deposit":
-            return _('txn_deposit_plus')
-        elif transaction.transaction_type == "withdrawal":
-            return _('txn_withdraw_minus')
-        elif transaction.transaction_type == "transfer":
-            if transaction.from_account_id == account_id:
-                return _('txn_sent_minus')
-            else:
-                return _('txn_received_plus')
-        return transaction.transaction_type.upper()
+        if self._txn_labels is None:
+            # Translated once per run (the language is fixed after
+            # startup); each row then costs one dict lookup instead of
+            # an if/elif chain of string comparisons and _() calls.
+            self._txn_labels = {
+                ("deposit", False): _('txn_deposit_plus'),
+                ("withdrawal", False): _('txn_withdraw_minus'),
+                ("transfer", True): _('txn_sent_minus'),
+                ("transfer", False): _('txn_received_plus'),
+            }
+        txn_type = transaction.transaction_type
+        label = self._txn_labels.get(
+            (txn_type,
+             txn_type == "transfer" and transaction.from_account_id == account_id))
+        return label if label is not None else txn_type.upper()
     
-    def exit_application(self):
+    async def exit_application(self):
         """Handle application exit."""
-        print("\n" + "=" * 40)
-        print(f"🚪 {_('menu_exit')}")
-        print("=" * 40)
+        print(f"\n{_EQ40}\n🚪 {_('menu_exit')}\n{_EQ40}")
         
         accounts = self.ledger.list_accounts()
         total_balance = self.ledger.get_total_system_balance()
@@ -575,7 +697,15 @@ def main():
     
     try:
         cli = MultilingualBankCLI(db_path)
-        cli.start()
+        if cli._session is not None:
+            # patch_stdout keeps concurrent prints from corrupting the
+            # prompt line while prompt_toolkit owns the terminal
+            async def _run():
+                with patch_stdout():
+                    await cli.start()
+            asyncio.run(_run())
+        else:
+            asyncio.run(cli.start())
     except Exception as e:
         print(f"\n💥 Fatal error: {e}")
         # Try to give more helpful error message
@@ -23,6 +23,9 @@ class LanguageManager:
         self.current_language = 'en'  # Default to English
         self.translations = {}
         self.available_languages = {}
+        # Memoized key -> resolved template for the current language;
+        # cleared whenever the language or the catalogs change
+        self._resolved_cache: Dict[str, str] = {}
         
         self._load_available_languages()
         self._load_translations()
@@ -69,6 +72,7 @@ class LanguageManager:
         # If no translations loaded, create default English
         if not self.translations:
             self.translations['en'] = self._get_default_english_translations()
+        self._resolved_cache.clear()
     
     def _get_default_english_translations(self) -> Dict[str, str]:
         """Get default English translations (fallback)."""
@@ -178,6 +182,8 @@ class LanguageManager:
             'history_for': 'Transaction History for {name}:',
             'history_empty': 'No transactions found for {name}.',
             'history_total': 'Total transactions: {count}',
+            'history_page': 'Page {page}',
+            'history_page_prompt': 'Next page? (n = next, p = prev, q = quit):',
             
             # Account Deletion
             'delete_title': 'DELETE ACCOUNT',
@@ -241,6 +247,7 @@ class LanguageManager:
         """Set the current language."""
         if language_code in self.available_languages:
             self.current_language = language_code
+            self._resolved_cache.clear()
             return True
         return False
     
@@ -266,19 +273,30 @@ class LanguageManager:
     
     def get_text(self, key: str, **kwargs) -> str:
         """Get translated text for the given key."""
-        # Get translation for current language
-        if self.current_language in self.translations:
-            translation = self.translations[self.current_language].get(key)
-        else:
-            translation = None
-        
-        # Fallback to English if translation not found
-        if translation is None and self.current_language != 'en':
-            translation = self.translations.get('en', {}).get(key)
-        
-        # Final fallback to key itself
+        # Resolve the template through the memo first: the catalog walk
+        # and fallback chain run once per key per language, after which
+        # repeated lookups (menu redraws, table rows) are one dict hit
+        translation = self._resolved_cache.get(key)
         if translation is None:
-            translation = key
+            # Get translation for current language
+            if self.current_language in self.translations:
+                translation = self.translations[self.current_language].get(key)
+            else:
+                translation = None
+            
+            # Fallback to English if translation not found
+            if translation is None and self.current_language != 'en':
+                translation = self.translations.get('en', {}).get(key)
+            
+            # Final fallback to key itself
+            if translation is None:
+                translation = key
+            self._resolved_cache[key] = translation
+        
+        # Static strings skip str.format entirely (a format call with no
+        # arguments would only ever raise and return the raw template)
+        if not kwargs:
+            return translation
         
         # Format with provided parameters
         try:
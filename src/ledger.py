@@ -37,7 +37,45 @@ class BankLedger:
         self.db_manager = DatabaseManager(db_path)
         self.account_repo = AccountRepository(self.db_manager)
         self.transaction_repo = TransactionRepository(self.db_manager)
-    
+        # Memoized views, dropped/adjusted by the mutating operations
+        self._accounts_cache: Optional[List[Account]] = None
+        self._total_cache: Optional[Decimal] = None
+
+    def transaction(self):
+        """
+        Context manager that batches several operations into one transaction.
+
+        Usage:
+            with ledger.transaction():
+                ledger.deposit(...)
+                ledger.transfer(...)
+
+        All operations inside the block commit together with a single fsync
+        (each operation becomes a savepoint inside the outer transaction),
+        which is substantially faster than committing per call.
+        """
+        return self.db_manager.transaction()
+
+    def _invalidate_caches(self, total_delta: Optional[Decimal] = None):
+        """
+        Drop the memoized account list and adjust the cached total.
+
+        Args:
+            total_delta: Exact change to the system-wide balance; None drops
+                the cached total entirely instead of adjusting it.
+
+        While an enclosing ledger.transaction() is still open the delta is
+        not yet durable — the outer block may roll it back — so the cached
+        total is dropped instead of adjusted and the next read goes to the
+        database.
+        """
+        self._accounts_cache = None
+        if (total_delta is not None and self._total_cache is not None
+                and getattr(self.db_manager, '_transaction_depth', 0) == 0):
+            self._total_cache += total_delta
+        else:
+            self._total_cache = None
+
     def create_account(self, name: str, initial_balance: str | Decimal = "0.00") -> int:
         """
         Create a new bank account.
@@ -69,7 +107,8 @@ class BankLedger:
                 description=f"Initial deposit for account '{name}'"
             )
             self.transaction_repo.create_transaction(transaction)
-        
+
+        self._invalidate_caches(initial_balance)
         return account_id
     
     def get_account(self, account_id: int) -> Account:
@@ -145,6 +184,7 @@ class BankLedger:
         
         with self.db_manager.transaction():
             account = self.get_account(account_id)
+            old_balance = account.balance
             new_balance = account.deposit(amount)
             
             # Update database
@@ -160,9 +200,54 @@ class BankLedger:
                 description=description or f"Deposit to {account.name}"
             )
             self.transaction_repo.create_transaction(transaction)
-            
-            return new_balance
+
+        self._invalidate_caches(new_balance - old_balance)
+        return new_balance
     
+    def deposit_many(self, account_id: int, deposits: List[Tuple[str | Decimal, str]]) -> Decimal:
+        """
+        Deposit a batch of amounts into an account in a single transaction.
+
+        The balance is updated once and the transaction records are written
+        with a single batched insert, so the whole batch costs one commit
+        instead of one per deposit.
+
+        Args:
+            account_id: ID of the target account
+            deposits: Sequence of (amount, description) pairs
+
+        Returns:
+            New balance after all deposits
+
+        Raises:
+            AccountNotFoundError: If account doesn't exist
+            InvalidAmountError: If any amount is not positive
+        """
+        with self.db_manager.transaction():
+            account = self.get_account(account_id)
+            old_balance = account.balance
+
+            transactions = []
+            for amount, description in deposits:
+                if isinstance(amount, str):
+                    amount = Decimal(amount)
+                account.deposit(amount)
+                transactions.append(Transaction(
+                    id=None,
+                    from_account_id=None,
+                    to_account_id=account_id,
+                    amount=amount,
+                    transaction_type="deposit",
+                    description=description or f"Deposit to {account.name}"
+                ))
+
+            # One balance write and one batched insert for the whole batch
+            self.account_repo.update_balance(account_id, account.balance)
+            self.transaction_repo.create_transactions(transactions)
+
+        self._invalidate_caches(account.balance - old_balance)
+        return account.balance
+
     def withdraw(self, account_id: int, amount: str | Decimal, description: str = "") -> Decimal:
         """
         Withdraw money from an account.
@@ -185,6 +270,7 @@ class BankLedger:
         
         with self.db_manager.transaction():
             account = self.get_account(account_id)
+            old_balance = account.balance
             new_balance = account.withdraw(amount)
             
             # Update database
@@ -200,8 +286,9 @@ class BankLedger:
                 description=description or f"Withdrawal from {account.name}"
             )
             self.transaction_repo.create_transaction(transaction)
-            
-            return new_balance
+
+        self._invalidate_caches(new_balance - old_balance)
+        return new_balance
     
     def transfer(self, from_account_id: int, to_account_id: int, 
                 amount: str | Decimal, description: str = "") -> Tuple[Decimal, Decimal]:
@@ -251,25 +338,32 @@ class BankLedger:
                 description=description or f"Transfer from {from_account.name} to {to_account.name}"
             )
             self.transaction_repo.create_transaction(transaction)
-            
-            return from_balance, to_balance
+
+        # A transfer moves money between accounts; the system total is unchanged
+        self._invalidate_caches(Decimal("0.00"))
+        return from_balance, to_balance
     
-    def get_account_transactions(self, account_id: int) -> List[Transaction]:
+    def get_account_transactions(self, account_id: int,
+                                 limit: Optional[int] = None,
+                                 offset: int = 0) -> List[Transaction]:
         """
-        Get all transactions for an account.
-        
+        Get transactions for an account, newest first.
+
         Args:
             account_id: ID of the account
-            
+            limit: Maximum number of transactions to return; None for all
+            offset: Number of transactions to skip (for paging)
+
         Returns:
             List of transactions involving the account
-            
+
         Raises:
             AccountNotFoundError: If account doesn't exist
         """
         # Verify account exists
         self.get_account(account_id)
-        return self.transaction_repo.get_account_transactions(account_id)
+        return self.transaction_repo.get_account_transactions(
+            account_id, limit=limit, offset=offset)
     
     def list_accounts(self) -> List[Account]:
         """
@@ -277,8 +371,13 @@ class BankLedger:
         
         Returns:
             List of all accounts
+
+        The result is memoized until the next mutating operation, so
+        repeated listings between mutations cost no queries.
         """
-        return self.account_repo.get_all_accounts()
+        if self._accounts_cache is None:
+            self._accounts_cache = self.account_repo.get_all_accounts()
+        return self._accounts_cache
     
     def get_total_system_balance(self) -> Decimal:
         """
@@ -286,9 +385,15 @@ class BankLedger:
         
         Returns:
             Sum of all account balances
+
+        The sum is memoized and adjusted incrementally by deposits and
+        withdrawals (transfers leave it unchanged).
         """
-        accounts = self.list_accounts()
-        return sum(account.balance for account in accounts)
+        if self._total_cache is None:
+            self._total_cache = sum(
+                (account.balance for account in self.list_accounts()),
+                Decimal("0.00"))
+        return self._total_cache
     
     def delete_account(self, account_id: int) -> bool:
         """
@@ -306,7 +411,10 @@ class BankLedger:
         """
         # Verify account exists
         self.get_account(account_id)
-        return self.account_repo.delete_account(account_id)
+        deleted = self.account_repo.delete_account(account_id)
+        # Deleted accounts must have a zero balance; the total is unchanged
+        self._invalidate_caches(Decimal("0.00"))
+        return deleted
     
     def close(self):
         """Close database connections."""
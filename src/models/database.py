@@ -15,6 +15,14 @@ class DatabaseManager:
         self.db_path = db_path
         self.connection = sqlite3.connect(db_path, check_same_thread=False)
         self.connection.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            # WAL + synchronous=NORMAL halves the fsyncs per commit and lets
+            # readers run during writes; journal modes are meaningless for
+            # in-memory databases, so those keep the defaults.
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("PRAGMA temp_store=MEMORY")
+            self.connection.execute("PRAGMA cache_size=-65536")
         self._init_database()
     
     def _init_database(self):
@@ -54,9 +62,14 @@ class DatabaseManager:
         """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_transactions_to_account 
+            CREATE INDEX IF NOT EXISTS idx_transactions_to_account
             ON transactions(to_account_id)
         """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_transactions_created_at
+            ON transactions(created_at)
+        """)
         
         self.connection.commit()
         
@@ -79,18 +92,29 @@ class DatabaseManager:
                 return cursor.fetchone()
             return cursor.fetchall()
 
-        # For INSERT/UPDATE/DELETE and others, commit the change.
-        self.connection.commit()
+        # For INSERT/UPDATE/DELETE and others, commit the change — unless a
+        # transaction() is active, in which case the commit belongs to it.
+        if getattr(self, '_transaction_depth', 0) == 0:
+            self.connection.commit()
         # For non-select queries, caller may expect the cursor for lastrowid or rowcount.
         return cursor
-    
+
     def execute_insert(self, query: str, params: tuple = ()) -> int:
         """Execute an insert query and return the last row ID."""
         cursor = self.connection.cursor()
         cursor.execute(query, params)
-        self.connection.commit()
+        if getattr(self, '_transaction_depth', 0) == 0:
+            self.connection.commit()
         return cursor.lastrowid
 
+    def execute_many(self, query: str, params_seq) -> int:
+        """Execute a query once per parameter tuple and return the row count."""
+        cursor = self.connection.cursor()
+        cursor.executemany(query, params_seq)
+        if getattr(self, '_transaction_depth', 0) == 0:
+            self.connection.commit()
+        return cursor.rowcount
+
     @contextmanager
     def transaction(self):
         """Context manager for a database transaction.
@@ -99,28 +123,49 @@ class DatabaseManager:
             with db.transaction():
                 # do multiple db operations
 
-        Commits on success, rolls back on exception.
+        Commits on success, rolls back on exception. Transactions nest:
+        an inner call while one is already active becomes a SAVEPOINT, so
+        callers can batch several ledger operations into one commit (one
+        fsync) while each operation keeps its own atomicity.
         Thread-safe via an internal lock to avoid concurrent BEGIN/COMMIT races.
         """
         # Ensure only one thread can start/commit a transaction at a time.
+        # Reentrant so the same thread can nest transaction() calls.
         lock = getattr(self, '_transaction_lock', None)
         if lock is None:
-            self._transaction_lock = threading.Lock()
+            self._transaction_lock = threading.RLock()
             lock = self._transaction_lock
 
         lock.acquire()
+        depth = getattr(self, '_transaction_depth', 0)
+        self._transaction_depth = depth + 1
         try:
-            try:
-                self.connection.execute('BEGIN')
-            except Exception:
-                # Some SQLite wrappers auto-begin; ignore if BEGIN fails.
-                pass
-            yield
-            self.connection.commit()
-        except Exception:
-            self.connection.rollback()
-            raise
+            if depth == 0:
+                try:
+                    # IMMEDIATE takes the write lock up front instead of
+                    # upgrading mid-transaction on the first write.
+                    self.connection.execute('BEGIN IMMEDIATE')
+                except Exception:
+                    # Some SQLite wrappers auto-begin; ignore if BEGIN fails.
+                    pass
+                try:
+                    yield
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+            else:
+                savepoint = f"sp_level_{depth}"
+                self.connection.execute(f'SAVEPOINT {savepoint}')
+                try:
+                    yield
+                    self.connection.execute(f'RELEASE SAVEPOINT {savepoint}')
+                except Exception:
+                    self.connection.execute(f'ROLLBACK TO SAVEPOINT {savepoint}')
+                    self.connection.execute(f'RELEASE SAVEPOINT {savepoint}')
+                    raise
         finally:
+            self._transaction_depth = depth
             lock.release()
     
     def close(self):
@@ -148,6 +193,9 @@ class DatabaseTriggersManager:
     def __init__(self, connection):
         """Initialize the triggers manager with a database connection"""
         self.connection = connection
+        # Memoized list_triggers result; dropped whenever a trigger is
+        # created or removed
+        self._triggers_cache: Optional[list] = None
     
     def create_account_deletion_prevention_trigger(self):
         """
@@ -160,10 +208,11 @@ class DatabaseTriggersManager:
             FOR EACH ROW
             WHEN CAST(OLD.balance AS REAL) != 0.0
             BEGIN
-                SELECT RAISE(ABORT, 'Cannot delete account with non-zero balance. Current balance: ' || OLD.balance);
+                SELECT RAISE(ABORT, 'Cannot delete account with non-zero balance');
             END;
         """)
         self.connection.commit()
+        self._triggers_cache = None
     
     def create_negative_balance_prevention_trigger(self):
         """
@@ -176,10 +225,11 @@ class DatabaseTriggersManager:
             FOR EACH ROW
             WHEN CAST(NEW.balance AS REAL) < 0.0
             BEGIN
-                SELECT RAISE(ABORT, 'Account balance cannot be negative. Attempted balance: ' || NEW.balance);
+                SELECT RAISE(ABORT, 'Account balance cannot be negative');
             END;
         """)
         self.connection.commit()
+        self._triggers_cache = None
     
     def create_transaction_consistency_trigger(self):
         """
@@ -192,10 +242,11 @@ class DatabaseTriggersManager:
             FOR EACH ROW
             WHEN CAST(NEW.amount AS REAL) <= 0.0
             BEGIN
-                SELECT RAISE(ABORT, 'Transaction amount must be positive. Attempted amount: ' || NEW.amount);
+                SELECT RAISE(ABORT, 'Transaction amount must be positive');
             END;
         """)
         self.connection.commit()
+        self._triggers_cache = None
     
     def create_all_protection_triggers(self):
         """Create all protection triggers for comprehensive data integrity."""
@@ -204,20 +255,30 @@ class DatabaseTriggersManager:
         self.create_transaction_consistency_trigger()
     
     def list_triggers(self):
-        """List all triggers currently in the database."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT name, sql FROM sqlite_master 
-            WHERE type = 'trigger'
-            ORDER BY name
-        """)
-        return [{'name': row[0], 'sql': row[1]} for row in cursor.fetchall()]
+        """List all triggers currently in the database.
+
+        The result is memoized — triggers only change through this class,
+        so the sqlite_master query runs once until a create/drop call
+        invalidates the cache.
+        """
+        if self._triggers_cache is None:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT name, sql FROM sqlite_master 
+                WHERE type = 'trigger'
+                ORDER BY name
+            """)
+            self._triggers_cache = [
+                {'name': row[0], 'sql': row[1]} for row in cursor.fetchall()
+            ]
+        return self._triggers_cache
     
     def drop_trigger(self, trigger_name: str):
         """Drop a specific trigger from the database."""
         cursor = self.connection.cursor()
         cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
         self.connection.commit()
+        self._triggers_cache = None
     
     def drop_all_protection_triggers(self):
         """Remove all protection triggers from the database"""
@@ -69,7 +69,26 @@ class TransactionRepository:
             transaction.description
         )
         return self.db.execute_insert(query, params)
-    
+
+    def create_transactions(self, transactions: list[Transaction]) -> int:
+        """Create a batch of transactions with a single executemany call."""
+        query = """
+            INSERT INTO transactions
+            (from_account_id, to_account_id, amount, transaction_type, description)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        params_seq = [
+            (
+                transaction.from_account_id,
+                transaction.to_account_id,
+                self.db.decimal_to_str(transaction.amount),
+                transaction.transaction_type,
+                transaction.description
+            )
+            for transaction in transactions
+        ]
+        return self.db.execute_many(query, params_seq)
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """Get a transaction by its ID."""
         query = """
@@ -83,16 +102,27 @@ class TransactionRepository:
             return self._row_to_transaction(row)
         return None
     
-    def get_account_transactions(self, account_id: int) -> list[Transaction]:
-        """Get all transactions for a specific account."""
+    def get_account_transactions(self, account_id: int,
+                                 limit: Optional[int] = None,
+                                 offset: int = 0) -> list[Transaction]:
+        """Get transactions for a specific account, newest first.
+
+        When ``limit`` is given only that window of rows is serialized by
+        SQLite, so callers can page through long histories without
+        materializing them.
+        """
         query = """
-            SELECT id, from_account_id, to_account_id, amount, 
+            SELECT id, from_account_id, to_account_id, amount,
                    transaction_type, description, created_at
             FROM transactions
             WHERE from_account_id = ? OR to_account_id = ?
             ORDER BY id DESC
         """
-        rows = self.db.execute_query(query, (account_id, account_id))
+        params: tuple = (account_id, account_id)
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        rows = self.db.execute_query(query, params)
         return [self._row_to_transaction(row) for row in rows]
     
     def _row_to_transaction(self, row) -> Transaction:
@@ -39,7 +39,7 @@ echo 🖥️  Backend rodará em: http://localhost:8000
 echo 🌐 Frontend rodará em: http://localhost:3000
 echo.
 
-start "CoreLedger API" cmd /k "call .venv\Scripts\activate && python api/main.py"
+start "CoreLedger API" cmd /k "call .venv\Scripts\activate && python -m api.main"
 timeout /t 3 >nul
 start "CoreLedger Frontend" cmd /k "cd frontend && npm start"
 
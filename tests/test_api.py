@@ -1,4 +1,4 @@
-import json
+import msgpack
 from starlette.testclient import TestClient
 
 from api.standalone_api import app
@@ -30,7 +30,8 @@ def test_simulate_transaction():
 
 def test_websocket_initial_update():
     with client.websocket_connect("/ws") as websocket:
-        message = websocket.receive_text()
-        data = json.loads(message)
+        # The initial snapshot is sent as a binary MessagePack frame
+        message = websocket.receive_bytes()
+        data = msgpack.unpackb(message, raw=False)
         assert data.get("type") == "dashboard_update"
         assert "data" in data
@@ -240,6 +240,101 @@ class TestBankLedger:
         with pytest.raises(ValueError, match="Cannot delete account with non-zero balance"):
             ledger.delete_account(account_id)
     
+    def test_deposit_many_valid(self, ledger):
+        """Test batch deposit applies every amount in one transaction."""
+        account_id = ledger.create_account("John Doe", "100.00")
+        new_balance = ledger.deposit_many(account_id, [
+            ("10.00", "First"),
+            ("20.00", "Second"),
+            ("30.00", "Third"),
+        ])
+
+        assert new_balance == Decimal("160.00")
+        assert ledger.get_balance(account_id) == Decimal("160.00")
+
+        transactions = ledger.get_account_transactions(account_id)
+        # Initial deposit + three batch deposits
+        assert len(transactions) == 4
+
+    def test_deposit_many_invalid_amount_rolls_back_batch(self, ledger):
+        """Test an invalid amount mid-batch rolls back the whole batch."""
+        account_id = ledger.create_account("John Doe", "100.00")
+
+        with pytest.raises(InvalidAmountError, match="Deposit amount must be positive"):
+            ledger.deposit_many(account_id, [
+                ("10.00", "Good"),
+                ("-5.00", "Bad"),
+                ("20.00", "Never reached"),
+            ])
+
+        # Nothing from the batch should be visible
+        assert ledger.get_balance(account_id) == Decimal("100.00")
+        transactions = ledger.get_account_transactions(account_id)
+        assert len(transactions) == 1  # Initial deposit only
+
+    def test_transaction_savepoint_rollback_preserves_outer(self, ledger):
+        """Test a failed operation inside transaction() only undoes itself."""
+        account_id = ledger.create_account("John Doe", "100.00")
+
+        with ledger.transaction():
+            ledger.deposit(account_id, "50.00")
+            # Fails on its own savepoint; the outer transaction survives
+            with pytest.raises(InsufficientFundsError):
+                ledger.withdraw(account_id, "1000.00")
+            ledger.deposit(account_id, "25.00")
+
+        assert ledger.get_balance(account_id) == Decimal("175.00")
+        transactions = ledger.get_account_transactions(account_id)
+        # Initial deposit + two successful deposits; no withdrawal record
+        assert len(transactions) == 3
+        assert all(tx.transaction_type == "deposit" for tx in transactions)
+
+    def test_total_balance_after_transaction_rollback(self, ledger):
+        """Test cached total is correct after an outer transaction rolls back."""
+        account_id = ledger.create_account("John Doe", "100.00")
+        assert ledger.get_total_system_balance() == Decimal("100.00")
+
+        with pytest.raises(RuntimeError, match="abort"):
+            with ledger.transaction():
+                ledger.deposit(account_id, "50.00")
+                raise RuntimeError("abort")
+
+        # The deposit was rolled back; the memoized total must not keep it
+        assert ledger.get_total_system_balance() == Decimal("100.00")
+        assert ledger.get_balance(account_id) == Decimal("100.00")
+
+    def test_total_balance_after_rounding_deposit(self, ledger):
+        """Test cached total tracks the quantized deposit amount."""
+        account_id = ledger.create_account("John Doe", "100.00")
+        assert ledger.get_total_system_balance() == Decimal("100.00")
+
+        # 10.999 rounds to 11.00 (ROUND_HALF_UP); the total must follow
+        # the stored balance, not the raw requested amount
+        new_balance = ledger.deposit(account_id, "10.999")
+        assert new_balance == Decimal("111.00")
+        assert ledger.get_total_system_balance() == Decimal("111.00")
+
+    def test_get_account_transactions_paging(self, ledger):
+        """Test limit and offset return consistent paging windows."""
+        account_id = ledger.create_account("John Doe", "100.00")
+        for i in range(5):
+            ledger.deposit(account_id, "10.00", f"Deposit {i}")
+
+        # Initial deposit + 5 deposits, newest first
+        all_transactions = ledger.get_account_transactions(account_id)
+        assert len(all_transactions) == 6
+
+        first_page = ledger.get_account_transactions(account_id, limit=2)
+        second_page = ledger.get_account_transactions(account_id, limit=2, offset=2)
+        last_page = ledger.get_account_transactions(account_id, limit=2, offset=4)
+
+        paged_ids = [tx.id for page in (first_page, second_page, last_page)
+                     for tx in page]
+        assert paged_ids == [tx.id for tx in all_transactions]
+
+        # Offset past the end yields an empty page
+        assert ledger.get_account_transactions(account_id, limit=2, offset=10) == []
+
     def test_context_manager(self):
         """Test using ledger as context manager."""
         with NamedTemporaryFile(suffix=".db", delete=False) as tmp_file: